@@ -61,13 +61,21 @@ except ImportError:
         WebDriverException, NoSuchWindowException, InvalidSessionIdException)
 
 import argparse
+import bisect
+import functools
+import itertools
+import json
 import logging
 import math
 import platform
+import queue
 import shutil
 import signal
 import random
+import string
+import threading
 import time
+import urllib.request
 import os
 
 # ===========================================================================
@@ -80,19 +88,35 @@ _log_handler.setFormatter(logging.Formatter("  [%(levelname)s] %(message)s"))
 log.addHandler(_log_handler)
 log.setLevel(logging.WARNING)  # default; --verbose sets to DEBUG
 
+# Cached log.isEnabledFor(DEBUG) for per-keystroke debug lines, so a disabled
+# log.debug() does not cost an arg tuple + level check on every key.
+# Refreshed in main() after --verbose is applied.
+_DEBUG_KEYS = False
+
 
 # ===========================================================================
 #  Constants
 # ===========================================================================
 
 MONKEYTYPE_URL = "https://monkeytype.com/"
+DEBUGGER_ADDRESS = "127.0.0.1:9222"  # Chrome --remote-debugging-port
 POLL_INTERVAL = 0.8
 INITIAL_WAIT = 8
 REFERENCE_WPM = 110        # Issue #10: extracted constant
 MAX_RETRY_PER_ROUND = 5    # Issue #19: prevent infinite retry loops
+HIGH_SPEED_WPM = 130       # above this, warn about detection risk
+
+# Resolved once; "Windows", "Darwin", "Linux", ...
+_PLATFORM = platform.system()
 
 # Platform-aware minimum sleep (Issue #5 note: Windows timer res ~15ms)
-MIN_SLEEP = 0.015 if platform.system() == "Windows" else 0.002
+MIN_SLEEP = 0.015 if _PLATFORM == "Windows" else 0.002
+
+# time.sleep is sub-ms accurate on POSIX (select, clock_nanosleep on 3.11+)
+# and on Windows from Python 3.11 (high-resolution waitable timer).  Older
+# Pythons on Windows round it to the ~15ms timer tick, so short waits there
+# are finished by spinning on perf_counter_ns.
+_SPIN_SLEEP = _PLATFORM == "Windows" and _sys.version_info < (3, 11)
 
 
 # ===========================================================================
@@ -100,226 +124,238 @@ MIN_SLEEP = 0.015 if platform.system() == "Windows" else 0.002
 #  Issues #1, #11, #12: full fingerprint defense suite
 # ===========================================================================
 
-def _build_stealth_js() -> str:
-    """Build platform-aware stealth injection script.
+def _webgl_strings() -> tuple:
+    """Issue #12: pick WebGL vendor/renderer strings that match the platform."""
+    if _PLATFORM == "Darwin":
+        return "Apple", "Apple M1 Pro"
+    if _PLATFORM == "Windows":
+        return ("Google Inc. (NVIDIA)",
+                "ANGLE (NVIDIA, NVIDIA GeForce RTX 3060 Direct3D11 vs_5_0 ps_5_0, D3D11)")
+    # Linux
+    return ("Google Inc. (Intel)",
+            "ANGLE (Intel, Mesa Intel(R) UHD Graphics 770 (ADL-S GT1), OpenGL 4.6)")
 
-    Issue #1:  Proper PluginArray with real plugin objects
-    Issue #11: Canvas, AudioContext, WebRTC, hardwareConcurrency, deviceMemory
-    Issue #12: Platform-matched WebGL vendor/renderer
-    """
-    # Issue #12: pick WebGL strings that match the current platform
-    system = platform.system()
-    if system == "Darwin":
-        gl_vendor = "Apple"
-        gl_renderer = "Apple M1 Pro"
-    elif system == "Windows":
-        gl_vendor = "Google Inc. (NVIDIA)"
-        gl_renderer = "ANGLE (NVIDIA, NVIDIA GeForce RTX 3060 Direct3D11 vs_5_0 ps_5_0, D3D11)"
-    else:  # Linux
-        gl_vendor = "Google Inc. (Intel)"
-        gl_renderer = "ANGLE (Intel, Mesa Intel(R) UHD Graphics 770 (ADL-S GT1), OpenGL 4.6)"
-
-    return f"""
+
+_STEALTH_TEMPLATE = string.Template("""
 // --- 1. Remove navigator.webdriver ---
-Object.defineProperty(navigator, 'webdriver', {{get: () => undefined}});
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
 
 // --- 2. Spoof window.chrome (Issue #11: full chrome object) ---
-window.chrome = {{
-    runtime: {{
-        onMessage: {{ addListener: function() {{}}, removeListener: function() {{}} }},
-        onConnect: {{ addListener: function() {{}}, removeListener: function() {{}} }},
-        sendMessage: function() {{}},
-        connect: function() {{ return {{ onMessage: {{ addListener: function() {{}} }}, postMessage: function() {{}} }}; }},
-        PlatformOs: {{MAC: 'mac', WIN: 'win', ANDROID: 'android', CROS: 'cros', LINUX: 'linux', OPENBSD: 'openbsd'}},
-        PlatformArch: {{ARM: 'arm', X86_32: 'x86-32', X86_64: 'x86-64', MIPS: 'mips', MIPS64: 'mips64'}},
-        requestUpdateCheck: function() {{}},
-        getManifest: function() {{ return {{}}; }},
+window.chrome = {
+    runtime: {
+        onMessage: { addListener: function() {}, removeListener: function() {} },
+        onConnect: { addListener: function() {}, removeListener: function() {} },
+        sendMessage: function() {},
+        connect: function() { return { onMessage: { addListener: function() {} }, postMessage: function() {} }; },
+        PlatformOs: {MAC: 'mac', WIN: 'win', ANDROID: 'android', CROS: 'cros', LINUX: 'linux', OPENBSD: 'openbsd'},
+        PlatformArch: {ARM: 'arm', X86_32: 'x86-32', X86_64: 'x86-64', MIPS: 'mips', MIPS64: 'mips64'},
+        requestUpdateCheck: function() {},
+        getManifest: function() { return {}; },
         id: undefined,
-    }},
-    loadTimes: function() {{ return {{}}; }},
-    csi: function() {{ return {{}}; }},
-    app: {{
+    },
+    loadTimes: function() { return {}; },
+    csi: function() { return {}; },
+    app: {
         isInstalled: false,
-        InstallState: {{INSTALLED: 'installed', DISABLED: 'disabled', NOT_INSTALLED: 'not_installed'}},
-        RunningState: {{RUNNING: 'running', CANNOT_RUN: 'cannot_run', READY_TO_RUN: 'ready_to_run'}},
-        getDetails: function() {{}},
-        getIsInstalled: function() {{}},
-        runningState: function() {{ return 'cannot_run'; }},
-    }},
-}};
+        InstallState: {INSTALLED: 'installed', DISABLED: 'disabled', NOT_INSTALLED: 'not_installed'},
+        RunningState: {RUNNING: 'running', CANNOT_RUN: 'cannot_run', READY_TO_RUN: 'ready_to_run'},
+        getDetails: function() {},
+        getIsInstalled: function() {},
+        runningState: function() { return 'cannot_run'; },
+    },
+};
 
 // --- 3. Override permissions query ---
 const originalQuery = window.navigator.permissions.query.bind(window.navigator.permissions);
 window.navigator.permissions.query = (parameters) =>
     parameters.name === 'notifications'
-        ? Promise.resolve({{ state: Notification.permission }})
+        ? Promise.resolve({ state: Notification.permission })
         : originalQuery(parameters);
 
 // --- 4. Spoof plugins (Issue #1: proper PluginArray objects) ---
-(function() {{
+(function() {
     const pluginData = [
-        {{name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer', description: 'Portable Document Format'}},
-        {{name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', description: ''}},
-        {{name: 'Chromium PDF Plugin', filename: 'internal-pdf-viewer', description: 'Portable Document Format'}},
-        {{name: 'Chromium PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', description: ''}},
-        {{name: 'Native Client', filename: 'internal-nacl-plugin', description: ''}},
+        {name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer', description: 'Portable Document Format'},
+        {name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', description: ''},
+        {name: 'Chromium PDF Plugin', filename: 'internal-pdf-viewer', description: 'Portable Document Format'},
+        {name: 'Chromium PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', description: ''},
+        {name: 'Native Client', filename: 'internal-nacl-plugin', description: ''},
     ];
-    const fakePlugins = pluginData.map(p => {{
+    const fakePlugins = pluginData.map(p => {
         const plugin = Object.create(Plugin.prototype);
-        Object.defineProperties(plugin, {{
-            name: {{ value: p.name, enumerable: true }},
-            filename: {{ value: p.filename, enumerable: true }},
-            description: {{ value: p.description, enumerable: true }},
-            length: {{ value: 0, enumerable: true }},
-        }});
+        Object.defineProperties(plugin, {
+            name: { value: p.name, enumerable: true },
+            filename: { value: p.filename, enumerable: true },
+            description: { value: p.description, enumerable: true },
+            length: { value: 0, enumerable: true },
+        });
         return plugin;
-    }});
+    });
     const fakePluginArray = Object.create(PluginArray.prototype);
-    for (let i = 0; i < fakePlugins.length; i++) {{
-        Object.defineProperty(fakePluginArray, i, {{ value: fakePlugins[i], enumerable: true }});
-    }}
-    Object.defineProperty(fakePluginArray, 'length', {{ value: fakePlugins.length }});
-    fakePluginArray.item = function(i) {{ return fakePlugins[i] || null; }};
-    fakePluginArray.namedItem = function(name) {{ return fakePlugins.find(p => p.name === name) || null; }};
-    fakePluginArray.refresh = function() {{}};
-    Object.defineProperty(navigator, 'plugins', {{ get: () => fakePluginArray }});
-}})();
+    for (let i = 0; i < fakePlugins.length; i++) {
+        Object.defineProperty(fakePluginArray, i, { value: fakePlugins[i], enumerable: true });
+    }
+    Object.defineProperty(fakePluginArray, 'length', { value: fakePlugins.length });
+    fakePluginArray.item = function(i) { return fakePlugins[i] || null; };
+    fakePluginArray.namedItem = function(name) { return fakePlugins.find(p => p.name === name) || null; };
+    fakePluginArray.refresh = function() {};
+    Object.defineProperty(navigator, 'plugins', { get: () => fakePluginArray });
+})();
 
 // --- 5. Spoof languages ---
-Object.defineProperty(navigator, 'languages', {{ get: () => ['en-US', 'en'] }});
+Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
 
 // --- 6. WebGL vendor/renderer (Issue #12: platform-matched) ---
 const getParameter = WebGLRenderingContext.prototype.getParameter;
-WebGLRenderingContext.prototype.getParameter = function(parameter) {{
-    if (parameter === 37445) return '{gl_vendor}';
-    if (parameter === 37446) return '{gl_renderer}';
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) return '${gl_vendor}';
+    if (parameter === 37446) return '${gl_renderer}';
     return getParameter.call(this, parameter);
-}};
+};
 const getParameter2 = WebGL2RenderingContext.prototype.getParameter;
-WebGL2RenderingContext.prototype.getParameter = function(parameter) {{
-    if (parameter === 37445) return '{gl_vendor}';
-    if (parameter === 37446) return '{gl_renderer}';
+WebGL2RenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) return '${gl_vendor}';
+    if (parameter === 37446) return '${gl_renderer}';
     return getParameter2.call(this, parameter);
-}};
+};
 
 // --- 7. Prevent iframe contentWindow detection ---
-try {{
+try {
     const descriptor = Object.getOwnPropertyDescriptor(HTMLIFrameElement.prototype, 'contentWindow');
-    Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {{
-        get: function() {{
+    Object.defineProperty(HTMLIFrameElement.prototype, 'contentWindow', {
+        get: function() {
             const win = descriptor.get.call(this);
-            try {{ win.chrome = window.chrome; }} catch(e) {{}}
+            try { win.chrome = window.chrome; } catch(e) {}
             return win;
-        }}
-    }});
-}} catch(e) {{}}
+        }
+    });
+} catch(e) {}
 
 // --- 8. Canvas fingerprint noise (Issue #11) ---
-(function() {{
+(function() {
     const origToDataURL = HTMLCanvasElement.prototype.toDataURL;
-    HTMLCanvasElement.prototype.toDataURL = function(type) {{
-        if (this.width > 16 && this.height > 16) {{
+    HTMLCanvasElement.prototype.toDataURL = function(type) {
+        if (this.width > 16 && this.height > 16) {
             const ctx = this.getContext('2d');
-            if (ctx) {{
+            if (ctx) {
                 const imageData = ctx.getImageData(0, 0, Math.min(this.width, 4), Math.min(this.height, 4));
-                for (let i = 0; i < imageData.data.length; i += 4) {{
+                for (let i = 0; i < imageData.data.length; i += 4) {
                     imageData.data[i] = imageData.data[i] ^ (Math.random() * 2 | 0);
-                }}
+                }
                 ctx.putImageData(imageData, 0, 0);
-            }}
-        }}
+            }
+        }
         return origToDataURL.apply(this, arguments);
-    }};
+    };
     const origToBlob = HTMLCanvasElement.prototype.toBlob;
-    HTMLCanvasElement.prototype.toBlob = function(callback, type, quality) {{
-        if (this.width > 16 && this.height > 16) {{
+    HTMLCanvasElement.prototype.toBlob = function(callback, type, quality) {
+        if (this.width > 16 && this.height > 16) {
             const ctx = this.getContext('2d');
-            if (ctx) {{
+            if (ctx) {
                 const imageData = ctx.getImageData(0, 0, Math.min(this.width, 4), Math.min(this.height, 4));
-                for (let i = 0; i < imageData.data.length; i += 4) {{
+                for (let i = 0; i < imageData.data.length; i += 4) {
                     imageData.data[i] = imageData.data[i] ^ (Math.random() * 2 | 0);
-                }}
+                }
                 ctx.putImageData(imageData, 0, 0);
-            }}
-        }}
+            }
+        }
         return origToBlob.apply(this, arguments);
-    }};
-}})();
+    };
+})();
 
 // --- 9. AudioContext fingerprint noise (Issue #11) ---
-(function() {{
+(function() {
     const origGetFloatFrequencyData = AnalyserNode.prototype.getFloatFrequencyData;
-    AnalyserNode.prototype.getFloatFrequencyData = function(array) {{
+    AnalyserNode.prototype.getFloatFrequencyData = function(array) {
         origGetFloatFrequencyData.call(this, array);
-        for (let i = 0; i < array.length; i++) {{
+        for (let i = 0; i < array.length; i++) {
             array[i] += (Math.random() - 0.5) * 0.1;
-        }}
-    }};
+        }
+    };
     const origCreateOscillator = AudioContext.prototype.createOscillator;
-    AudioContext.prototype.createOscillator = function() {{
+    AudioContext.prototype.createOscillator = function() {
         const osc = origCreateOscillator.call(this);
         const origConnect = osc.connect.bind(osc);
         // tiny detuning to change fingerprint
-        osc.connect = function(dest) {{
+        osc.connect = function(dest) {
             if (osc.detune) osc.detune.value += (Math.random() - 0.5) * 0.01;
             return origConnect(dest);
-        }};
+        };
         return osc;
-    }};
-}})();
+    };
+})();
 
 // --- 10. Hardware spoofing (Issue #11) ---
-Object.defineProperty(navigator, 'hardwareConcurrency', {{ get: () => {random.choice([4, 8, 12, 16])} }});
-Object.defineProperty(navigator, 'deviceMemory', {{ get: () => {random.choice([4, 8, 16])} }});
+Object.defineProperty(navigator, 'hardwareConcurrency', { get: () => ${hardware_concurrency} });
+Object.defineProperty(navigator, 'deviceMemory', { get: () => ${device_memory} });
 
 // --- 11. WebRTC IP leak prevention (Issue #11) ---
-(function() {{
-    if (window.RTCPeerConnection) {{
+(function() {
+    if (window.RTCPeerConnection) {
         const origRTC = window.RTCPeerConnection;
-        window.RTCPeerConnection = function(config) {{
-            if (config && config.iceServers) {{
+        window.RTCPeerConnection = function(config) {
+            if (config && config.iceServers) {
                 config.iceServers = [];
-            }}
+            }
             const pc = new origRTC(config);
             const origCreateOffer = pc.createOffer.bind(pc);
-            pc.createOffer = function(options) {{
+            pc.createOffer = function(options) {
                 if (options) options.offerToReceiveAudio = false;
                 return origCreateOffer(options);
-            }};
+            };
             return pc;
-        }};
+        };
         window.RTCPeerConnection.prototype = origRTC.prototype;
-    }}
-}})();
+    }
+})();
 
 // --- 12. Override toString to hide ALL modifications (Issue #8 from analysis) ---
-(function() {{
+(function() {
     const protoToString = Function.prototype.toString;
     const patchedFns = new WeakSet();
     const nativeStrings = new WeakMap();
 
-    function markPatched(fn, nativeStr) {{
+    function markPatched(fn, nativeStr) {
         patchedFns.add(fn);
         nativeStrings.set(fn, nativeStr);
-    }}
+    }
 
-    Function.prototype.toString = function() {{
-        if (patchedFns.has(this)) {{
-            return nativeStrings.get(this) || 'function () {{ [native code] }}';
-        }}
+    Function.prototype.toString = function() {
+        if (patchedFns.has(this)) {
+            return nativeStrings.get(this) || 'function () { [native code] }';
+        }
         return protoToString.call(this);
-    }};
+    };
 
     // Mark all our patches
-    markPatched(navigator.permissions.query, 'function query() {{ [native code] }}');
-    markPatched(WebGLRenderingContext.prototype.getParameter, 'function getParameter() {{ [native code] }}');
-    markPatched(WebGL2RenderingContext.prototype.getParameter, 'function getParameter() {{ [native code] }}');
-    markPatched(HTMLCanvasElement.prototype.toDataURL, 'function toDataURL() {{ [native code] }}');
-    markPatched(HTMLCanvasElement.prototype.toBlob, 'function toBlob() {{ [native code] }}');
-    markPatched(AnalyserNode.prototype.getFloatFrequencyData, 'function getFloatFrequencyData() {{ [native code] }}');
-    markPatched(Function.prototype.toString, 'function toString() {{ [native code] }}');
-}})();
-"""
+    markPatched(navigator.permissions.query, 'function query() { [native code] }');
+    markPatched(WebGLRenderingContext.prototype.getParameter, 'function getParameter() { [native code] }');
+    markPatched(WebGL2RenderingContext.prototype.getParameter, 'function getParameter() { [native code] }');
+    markPatched(HTMLCanvasElement.prototype.toDataURL, 'function toDataURL() { [native code] }');
+    markPatched(HTMLCanvasElement.prototype.toBlob, 'function toBlob() { [native code] }');
+    markPatched(AnalyserNode.prototype.getFloatFrequencyData, 'function getFloatFrequencyData() { [native code] }');
+    markPatched(Function.prototype.toString, 'function toString() { [native code] }');
+})();
+""")
+
+# The platform-matched WebGL strings never change within a process, so they
+# are substituted once at import; only the per-driver hardware values remain.
+_gl_vendor, _gl_renderer = _webgl_strings()
+_STEALTH_JS = string.Template(_STEALTH_TEMPLATE.safe_substitute(
+    gl_vendor=_gl_vendor, gl_renderer=_gl_renderer))
+
+
+def _build_stealth_js() -> str:
+    """Build platform-aware stealth injection script.
+
+    Issue #1:  Proper PluginArray with real plugin objects
+    Issue #11: Canvas, AudioContext, WebRTC, hardwareConcurrency, deviceMemory
+    Issue #12: Platform-matched WebGL vendor/renderer (pre-filled at import)
+    """
+    return _STEALTH_JS.substitute(
+        hardware_concurrency=random.choice([4, 8, 12, 16]),
+        device_memory=random.choice([4, 8, 16]),
+    )
 
 
 def apply_stealth(driver):
@@ -366,13 +402,30 @@ SPECIAL_KEYS = {
     "Tab":       {"key": "Tab",       "code": "Tab",       "keyCode": 9},
     "ShiftLeft": {"key": "Shift",     "code": "ShiftLeft",  "keyCode": 16},
 }
+_SHIFT_INFO = SPECIAL_KEYS["ShiftLeft"]
 
+# Private PRNG for the keystroke path.  Scaling the bound C-level random()
+# inline (lo + span * _rand()) skips the module lookup and the Python frame
+# of random.uniform() on every Shift gap.
+_rng = random.Random()
+_rand = _rng.random
 
-def char_to_key_info(char: str) -> dict:
+
+def _build_key_info(char: str) -> dict:
     """Map any character to CDP key event parameters.
 
     Issue #2: returns 'needs_shift' flag for uppercase and shift-punct chars.
     """
+    o = ord(char) if len(char) == 1 else -1
+    # ASCII letters: fold case with integer compares instead of
+    # isalpha/isupper/upper calls.
+    if 0x41 <= o <= 0x5a or 0x61 <= o <= 0x7a:
+        upper = o & 0xdf
+        return {
+            "key": char, "code": "Key" + chr(upper),
+            "keyCode": upper, "text": char,
+            "needs_shift": o <= 0x5a,
+        }
     if char.isalpha() and len(char) == 1:
         needs_shift = char.isupper()
         return {
@@ -401,26 +454,302 @@ def char_to_key_info(char: str) -> dict:
             "needs_shift": False}
 
 
+# Key info for every printable ASCII char, built once at import.
+# Values are shared between callers and must be treated as read-only.
+CHAR_KEY_INFO: dict[str, dict] = {c: _build_key_info(c) for c in string.printable}
+
+
+def char_to_key_info(char: str) -> dict:
+    """Look up CDP key event parameters for a character.
+
+    Printable ASCII is served from CHAR_KEY_INFO; anything else (e.g. accented
+    letters) falls back to building the info on the fly.
+    """
+    info = CHAR_KEY_INFO.get(char)
+    if info is None:
+        info = _build_key_info(char)
+    return info
+
+
+# JSON codec for DevTools socket traffic, bound once instead of going
+# through json.dumps/json.loads (and a fresh encoder) per message.  orjson
+# is used when installed; its bytes are sent as-is in a text frame.
+try:
+    import orjson
+    _cdp_dumps, _cdp_loads = orjson.dumps, orjson.loads
+except ImportError:
+    _cdp_dumps = json.JSONEncoder(separators=(",", ":")).encode
+    _cdp_loads = json.JSONDecoder().decode
+
+# Most commands CDPSocket lets go unanswered before send() waits for replies
+CDP_MAX_IN_FLIGHT = 32
+
+
+class CDPSocket:
+    """Fire-and-forget CDP client on the tab's own DevTools WebSocket.
+
+    execute_cdp_cmd is a blocking HTTP round trip through chromedriver per
+    call.  Commands sent here are only written to the socket: Chrome runs
+    them in order and a daemon thread drains the replies, so the keyUp of
+    one char and the keyDown of the next are in flight together instead of
+    each waiting out a round trip.  call() is the blocking variant for the
+    few commands whose result is needed.  If Chrome stalls, send() blocks
+    once CDP_MAX_IN_FLIGHT commands are unanswered, so keys are not queued
+    up to land in one burst.  Once the reader thread stops, the socket is
+    closed and send()/call() raise ConnectionError.
+    """
+
+    def __init__(self, ws):
+        self._ws = ws
+        self._ids = itertools.count(1)
+        # Message id -> (event, reply slot) for call()
+        self._calls: dict[int, tuple] = {}
+        self._in_flight = 0
+        self._flow = threading.Condition()
+        self.closed = False
+        self._reader = threading.Thread(target=self._drain, daemon=True)
+        self._reader.start()
+
+    def send(self, method: str, params: dict, msg_id: int | None = None):
+        if msg_id is None:
+            msg_id = next(self._ids)
+        with self._flow:
+            if self._in_flight >= CDP_MAX_IN_FLIGHT and not self._flow.wait_for(
+                    lambda: self._in_flight < CDP_MAX_IN_FLIGHT or self.closed,
+                    timeout=1.0):
+                log.debug("CDP replies stalled; sending anyway")
+            if self.closed:
+                raise ConnectionError("DevTools socket closed")
+            self._in_flight += 1
+        self._ws.send(_cdp_dumps(
+            {"id": msg_id, "method": method, "params": params}))
+
+    def call(self, method: str, params: dict, timeout: float = 2.0) -> dict:
+        """Send a command and wait for its result (raises on error/timeout)."""
+        msg_id = next(self._ids)
+        done, slot = threading.Event(), []
+        self._calls[msg_id] = (done, slot)
+        try:
+            self.send(method, params, msg_id)
+        except Exception:
+            self._calls.pop(msg_id, None)
+            raise
+        if not done.wait(timeout):
+            self._calls.pop(msg_id, None)
+            raise TimeoutError(f"{method}: no reply within {timeout}s")
+        if not slot:
+            raise ConnectionError(f"{method}: DevTools socket closed")
+        reply = slot[0]
+        if "error" in reply:
+            raise RuntimeError(f"{method}: {reply['error'].get('message')}")
+        return reply.get("result", {})
+
+    def _drain(self):
+        try:
+            self._read_replies()
+        finally:
+            # Unblock everyone waiting on a reply that will never come
+            with self._flow:
+                self.closed = True
+                self._flow.notify_all()
+            for done, _ in list(self._calls.values()):
+                done.set()
+
+    def _read_replies(self):
+        while True:
+            try:
+                reply = self._ws.recv()
+            except Exception as exc:
+                log.debug("DevTools socket reader stopped: %s", exc)
+                return
+            if not isinstance(reply, str):
+                continue  # not a JSON text frame
+            if reply.startswith('{"id":'):  # a reply, not an event
+                with self._flow:
+                    self._in_flight = max(0, self._in_flight - 1)
+                    self._flow.notify()
+            if self._calls:
+                try:
+                    msg = _cdp_loads(reply)
+                except ValueError as exc:
+                    log.debug("Unreadable CDP frame: %s", exc)
+                    continue
+                if not isinstance(msg, dict):
+                    continue
+                waiter = self._calls.pop(msg.get("id"), None)
+                if waiter is not None:
+                    waiter[1].append(msg)
+                    waiter[0].set()
+                    continue  # call() reports its own errors
+            if '"error"' in reply:
+                log.debug("CDP error reply: %s", reply)
+
+    def close(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+# Set by open_cdp_socket(); None means input goes through execute_cdp_cmd.
+_CDP_SOCKET: CDPSocket | None = None
+
+
+def _page_socket_urls(driver):
+    """Candidate DevTools socket URLs for the driver's tab, best first.
+
+    chromedriver window handles are DevTools target ids, so the page socket
+    is normally ws://DEBUGGER_ADDRESS/devtools/page/<handle>.  If that
+    fails, the page targets listed at http://DEBUGGER_ADDRESS/json/list
+    follow, the one showing the driver's URL first.
+    """
+    yield (f"ws://{DEBUGGER_ADDRESS}/devtools/page/"
+           f"{driver.current_window_handle}")
+    try:
+        with urllib.request.urlopen(f"http://{DEBUGGER_ADDRESS}/json/list",
+                                    timeout=2) as resp:
+            targets = json.load(resp)
+    except Exception as exc:
+        log.debug("DevTools target list unavailable: %s", exc)
+        return
+    pages = [t for t in targets
+             if t.get("type") == "page" and t.get("webSocketDebuggerUrl")]
+    current_url = driver.current_url
+    pages.sort(key=lambda t: t.get("url") != current_url)
+    for target in pages:
+        yield target["webSocketDebuggerUrl"]
+
+
+def open_cdp_socket(driver) -> CDPSocket | None:
+    """Connect a CDPSocket to the driver's current tab, if possible.
+
+    The Origin header is suppressed so Chrome accepts the connection
+    without --remote-allow-origins.  Falls back to execute_cdp_cmd when no
+    candidate from _page_socket_urls() connects.
+    """
+    global _CDP_SOCKET
+    _CDP_SOCKET = None
+    try:
+        import websocket  # websocket-client, installed with selenium
+    except ImportError as exc:
+        log.debug("DevTools socket unavailable, using execute_cdp_cmd: %s", exc)
+        return None
+    for url in _page_socket_urls(driver):
+        try:
+            ws = websocket.create_connection(url, timeout=2,
+                                             suppress_origin=True)
+        except Exception as exc:
+            log.debug("DevTools socket %s failed: %s", url, exc)
+            continue
+        ws.settimeout(None)
+        _CDP_SOCKET = CDPSocket(ws)
+        log.debug("Input events via DevTools socket %s", url)
+        break
+    else:
+        log.debug("DevTools socket unavailable, using execute_cdp_cmd")
+    return _CDP_SOCKET
+
+
+def _drop_cdp_socket(sock: CDPSocket):
+    """Stop using a failed DevTools socket; later calls use chromedriver."""
+    global _CDP_SOCKET
+    if _CDP_SOCKET is sock:
+        _CDP_SOCKET = None
+    sock.close()
+
+
+def _cdp_send(driver, method: str, params: dict):
+    """Send an input command over the DevTools socket, else execute_cdp_cmd."""
+    sock = _CDP_SOCKET
+    if sock is not None:
+        try:
+            sock.send(method, params)
+            return
+        except Exception as exc:
+            log.debug("DevTools socket send failed, falling back: %s", exc)
+            _drop_cdp_socket(sock)
+    driver.execute_cdp_cmd(method, params)
+
+
+def _js_call_expr(script: str, args: tuple) -> str:
+    """Runtime.evaluate expression calling function body script with args."""
+    return f"(function() {{{script}\n}}).apply(null, {json.dumps(args)})"
+
+
+def _eval_js(driver, script: str, *args):
+    """driver.execute_script(script, *args), over the DevTools socket if open.
+
+    script is a function body that may `return` and read arguments[i]; it
+    runs via Runtime.evaluate with returnByValue, skipping chromedriver's
+    HTTP hop.  Falls back to execute_script if the socket call fails, and
+    drops the socket if it timed out or is closed.  With driver=None there
+    is no fallback: ConnectionError is raised instead.
+    """
+    sock = _CDP_SOCKET
+    if sock is not None:
+        try:
+            result = sock.call("Runtime.evaluate", {
+                "expression": _js_call_expr(script, args),
+                "returnByValue": True})
+            if "exceptionDetails" not in result:
+                return result["result"].get("value")
+            log.debug("Socket eval threw: %s",
+                      result["exceptionDetails"].get("text"))
+        except RuntimeError as exc:  # CDP error reply; the socket is fine
+            log.debug("Socket eval failed, using execute_script: %s", exc)
+        except Exception as exc:
+            log.debug("DevTools socket eval failed, falling back: %s", exc)
+            _drop_cdp_socket(sock)
+    if driver is None:
+        raise ConnectionError("DevTools socket unavailable")
+    return driver.execute_script(script, *args)
+
+
+# Input.dispatchKeyEvent params per (event_type, key, code, text, modifiers).
+# Both send paths JSON-encode the params before returning, so the cached
+# dicts are never captured and can be reused for every keystroke.
+_KEY_EVENT_PARAMS: dict[tuple, dict] = {}
+
+
 def _cdp_dispatch_key(driver, event_type: str, key_info: dict,
                       modifiers: int = 0):
     """Low-level CDP key event dispatch."""
-    params = {
-        "type": event_type,
-        "key": key_info["key"],
-        "code": key_info["code"],
-        "windowsVirtualKeyCode": key_info["keyCode"],
-        "nativeVirtualKeyCode": key_info["keyCode"],
-        "modifiers": modifiers,
-    }
-    if event_type == "keyDown" and key_info.get("text"):
-        params["text"] = key_info["text"]
-        params["unmodifiedText"] = key_info["text"]
-    driver.execute_cdp_cmd("Input.dispatchKeyEvent", params)
+    text = key_info.get("text")
+    cache_key = (event_type, key_info["key"], key_info["code"], text, modifiers)
+    params = _KEY_EVENT_PARAMS.get(cache_key)
+    if params is None:
+        vk = key_info["keyCode"]
+        if event_type == "keyDown" and text:
+            params = {
+                "type": event_type, "key": key_info["key"],
+                "code": key_info["code"], "windowsVirtualKeyCode": vk,
+                "nativeVirtualKeyCode": vk, "modifiers": modifiers,
+                "text": text, "unmodifiedText": text,
+            }
+        else:
+            params = {
+                "type": event_type, "key": key_info["key"],
+                "code": key_info["code"], "windowsVirtualKeyCode": vk,
+                "nativeVirtualKeyCode": vk, "modifiers": modifiers,
+            }
+        _KEY_EVENT_PARAMS[cache_key] = params
+    _cdp_send(driver, "Input.dispatchKeyEvent", params)
 
 
-# Estimated round-trip overhead per CDP call (seconds).
-# Measured once at startup; used to compensate sleep times.
-CDP_OVERHEAD = 0.003  # conservative default, refined by calibration
+def _precise_sleep(seconds: float):
+    """Sleep for key hold/gap timings without OS timer-tick rounding.
+
+    Coarse-sleeps until MIN_SLEEP before the target (one timer tick), then
+    spins for the remainder.  A plain time.sleep where that is already precise.
+    """
+    if not _SPIN_SLEEP:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter_ns() + int(seconds * 1e9)
+    if seconds > MIN_SLEEP:
+        time.sleep(seconds - MIN_SLEEP)
+    while time.perf_counter_ns() < end:
+        pass
 
 
 def cdp_key_down(driver, key_info: dict, modifiers: int = 0):
@@ -435,44 +764,127 @@ def cdp_key_up(driver, key_info: dict, modifiers: int = 0):
     _cdp_dispatch_key(driver, "keyUp", key_info, modifiers)
 
 
+def cdp_batch_keys(driver, events: list) -> float:
+    """Dispatch a sequence of key events on a single shared timeline.
+
+    Each event is a ``(event_type, key_info, modifiers, delay)`` tuple, where
+    event_type is "keyDown" or "keyUp" and delay is the wait (seconds) before
+    the next event.  Delays are measured against deadlines anchored at the
+    start of the batch, so the round-trip time of each CDP call is absorbed
+    into the following gap instead of being stacked on top of it.
+
+    Returns the perf_counter deadline of the last event, so callers can keep
+    scheduling on the same timeline.
+    """
+    deadline = time.perf_counter()
+    for event_type, key_info, modifiers, delay in events:
+        if event_type == "keyUp":
+            cdp_key_up(driver, key_info, modifiers)
+        else:
+            cdp_key_down(driver, key_info, modifiers)
+        if delay > 0:
+            deadline += delay
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                _precise_sleep(remaining)
+    return deadline
+
+
 def cdp_press_key(driver, key_info: dict, hold_duration: float = 0.0,
                   modifiers: int = 0):
     """Full key press: down, hold, up.
 
-    Compensates hold_duration for the CDP overhead of the keyUp call,
-    so the actual keyDown-to-keyUp wall time matches the requested hold.
+    The keyUp deadline is anchored before the keyDown call, so the CDP
+    overhead of the keyDown is absorbed by the hold instead of extending it.
     """
-    cdp_key_down(driver, key_info, modifiers)
-    if hold_duration > 0:
-        # Subtract one CDP call overhead (for the upcoming keyUp)
-        compensated = max(MIN_SLEEP, hold_duration - CDP_OVERHEAD)
-        time.sleep(compensated)
-    cdp_key_up(driver, key_info, modifiers)
+    cdp_batch_keys(driver, [
+        ("keyDown", key_info, modifiers, hold_duration),
+        ("keyUp", key_info, modifiers, 0.0),
+    ])
 
 
 def cdp_type_char(driver, char: str, hold_duration: float = 0.0):
     """Type a single character via CDP.
 
     Issue #2: dispatches Shift keyDown/keyUp around uppercase and shift-punct
-    characters, with realistic Shift hold timing.
-
-    Returns the estimated wall-clock overhead (CDP calls) beyond the requested
-    hold_duration, so callers can subtract it from subsequent sleep.
+    characters, with realistic Shift hold timing.  The whole Shift/char
+    sequence is scheduled as one batch on a shared timeline.
     """
     info = char_to_key_info(char)
     if info["needs_shift"]:
-        # Shift down (hold Shift while typing the char)
-        shift_info = SPECIAL_KEYS["ShiftLeft"]
-        cdp_key_down(driver, shift_info)
-        time.sleep(random.uniform(0.012, 0.035))  # realistic pre-char Shift hold
-        # Char with modifiers=8 (Shift modifier flag)
-        cdp_press_key(driver, info, hold_duration, modifiers=8)
-        time.sleep(random.uniform(0.008, 0.025))  # brief gap before Shift release
-        cdp_key_up(driver, shift_info)
+        cdp_batch_keys(driver, [
+            # Shift down (hold Shift while typing the char)
+            ("keyDown", _SHIFT_INFO, 0, 0.012 + 0.023 * _rand()),
+            # Char with modifiers=8 (Shift modifier flag)
+            ("keyDown", info, 8, hold_duration),
+            # Brief gap before Shift release
+            ("keyUp", info, 8, 0.008 + 0.017 * _rand()),
+            ("keyUp", _SHIFT_INFO, 0, 0.0),
+        ])
+    elif _INSERT_TEXT_OK:
+        # One CDP call instead of keyDown + keyUp; the hold is still slept
+        # so the typing rhythm is unchanged.
+        deadline = time.perf_counter() + hold_duration
+        cdp_insert_text(driver, info["text"])
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            _precise_sleep(remaining)
     else:
         cdp_press_key(driver, info, hold_duration)
 
 
+def cdp_insert_text(driver, text: str):
+    """Commit text via Input.insertText (fires `input`, no keydown/keyup).
+
+    Callers pass one char at a time: the page timestamps each `input` event,
+    so a multi-char insert would land a whole run at a single instant.
+    """
+    _cdp_send(driver, "Input.insertText", {"text": text})
+
+
+# Set by probe_insert_text().  Unshifted chars are sent with Input.insertText
+# only when the page has no keydown/keyup listeners that would miss them.
+_INSERT_TEXT_OK = False
+
+# Runs with includeCommandLineAPI so getEventListeners() is available.
+_KEY_LISTENER_PROBE_JS = """
+(function() {
+    var el = document.getElementById('wordsInput');
+    if (!el) return true;
+    var targets = [window];
+    for (var n = el; n; n = n.parentNode) targets.push(n);
+    return targets.some(function(t) {
+        var l = getEventListeners(t);
+        return !!(l.keydown || l.keyup || l.keypress);
+    });
+})()
+"""
+
+
+def probe_insert_text(driver) -> bool:
+    """A/B check whether the typing input can be driven by Input.insertText.
+
+    insertText halves the CDP calls per unshifted char, but skips keydown/
+    keyup.  If anything on the input's path listens for key events (e.g. for
+    keySpacing/keyDuration stats), keep full key events.
+    """
+    global _INSERT_TEXT_OK
+    try:
+        resp = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": _KEY_LISTENER_PROBE_JS,
+            "includeCommandLineAPI": True,
+            "returnByValue": True,
+        })
+        has_key_listeners = resp.get("result", {}).get("value")
+    except Exception as exc:
+        log.debug("insertText probe failed: %s", exc)
+        has_key_listeners = True
+    _INSERT_TEXT_OK = has_key_listeners is False
+    log.debug("Keystroke path: %s",
+              "Input.insertText" if _INSERT_TEXT_OK else "dispatchKeyEvent")
+    return _INSERT_TEXT_OK
+
+
 def cdp_backspace(driver, hold_duration: float = 0.0):
     """Send a backspace keystroke via CDP."""
     cdp_press_key(driver, SPECIAL_KEYS["Backspace"], hold_duration)
@@ -481,7 +893,7 @@ def cdp_backspace(driver, hold_duration: float = 0.0):
 def cdp_mouse_move(driver, x: float, y: float):
     """Move mouse to (x, y) via CDP."""
     try:
-        driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+        _cdp_send(driver, "Input.dispatchMouseEvent", {
             "type": "mouseMoved", "x": int(x), "y": int(y),
         })
     except Exception as exc:
@@ -491,12 +903,12 @@ def cdp_mouse_move(driver, x: float, y: float):
 def cdp_mouse_click(driver, x: float, y: float):
     """Click at (x, y) via CDP."""
     try:
-        driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+        _cdp_send(driver, "Input.dispatchMouseEvent", {
             "type": "mousePressed", "x": int(x), "y": int(y),
             "button": "left", "clickCount": 1,
         })
         time.sleep(random.uniform(0.05, 0.12))
-        driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+        _cdp_send(driver, "Input.dispatchMouseEvent", {
             "type": "mouseReleased", "x": int(x), "y": int(y),
             "button": "left", "clickCount": 1,
         })
@@ -525,12 +937,22 @@ class OverlapState:
             try:
                 cdp_key_up(driver, self.held_key_info)
                 if self.held_needs_shift:
-                    cdp_key_up(driver, SPECIAL_KEYS["ShiftLeft"])
+                    cdp_key_up(driver, _SHIFT_INFO)
             except Exception as exc:
                 log.debug("Release held key failed: %s", exc)
             self.held_key_info = None
             self.held_needs_shift = False
 
+    def type_normal(self, driver, char: str, hold_duration: float,
+                    overlap_time: float = 0.0):
+        """Release any held key, then type char on its own.
+
+        Takes the same arguments as type_with_overlap() so callers can pick
+        either one per keystroke; overlap_time is unused.
+        """
+        self.release_held(driver)
+        cdp_type_char(driver, char, hold_duration)
+
     def type_with_overlap(self, driver, char: str, hold_duration: float,
                           overlap_time: float):
         """Type a char while the previous key is still held down (true rollover).
@@ -544,25 +966,25 @@ class OverlapState:
         """
         info = char_to_key_info(char)
         needs_shift = info["needs_shift"]
+        modifiers = 8 if needs_shift else 0
 
+        events = []
         # Press Shift if needed for this char
         if needs_shift:
-            cdp_key_down(driver, SPECIAL_KEYS["ShiftLeft"])
-            time.sleep(random.uniform(0.010, 0.025))
-
-        # Press the new key (previous still held)
-        modifiers = 8 if needs_shift else 0
-        cdp_key_down(driver, info, modifiers)
-
-        # Brief overlap period where both keys are held
-        time.sleep(overlap_time)
+            events.append(("keyDown", _SHIFT_INFO, 0, 0.010 + 0.015 * _rand()))
+        # Press the new key (previous still held), then a brief overlap
+        # period where both keys are held
+        events.append(("keyDown", info, modifiers, overlap_time))
+        deadline = cdp_batch_keys(driver, events)
 
         # Release the PREVIOUS key
         self.release_held(driver)
 
         # Hold the new key for the remaining duration
-        remaining = max(0.002, hold_duration - overlap_time)
-        time.sleep(remaining)
+        deadline += max(0.002, hold_duration - overlap_time)
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            _precise_sleep(remaining)
 
         # Store as currently held (will be released by next overlap or explicit release)
         self.held_key_info = info
@@ -610,13 +1032,29 @@ FINGER_HOLD = {
     4: 0.88, 5: 1.00, 6: 1.12, 7: 1.25, 8: 0.80,
 }
 
+# Finger-indexed tuples of the above (finger ids are small ints)
+_FINGER_SPEED_ARR = tuple(FINGER_SPEED.get(_f, 1.0) for _f in range(10))
+_FINGER_HOLD_ARR = tuple(FINGER_HOLD.get(_f, 1.0) for _f in range(10))
+
+
+# ASCII lookup tables indexed by ord(char), covering both letter cases, so
+# the hot path avoids a char.lower() allocation plus a dict probe per call.
+_FINGER_ARR = [5] * 128
+_ROW_ARR = [2] * 128
+for _k, _v in FINGER_MAP.items():
+    _FINGER_ARR[ord(_k)] = _FINGER_ARR[ord(_k.upper())] = _v
+for _k, _v in KEY_ROW.items():
+    _ROW_ARR[ord(_k)] = _ROW_ARR[ord(_k.upper())] = _v
+
 
 def get_finger(char: str) -> int:
-    return FINGER_MAP.get(char.lower(), 5)
+    o = ord(char)
+    return _FINGER_ARR[o] if o < 128 else FINGER_MAP.get(char.lower(), 5)
 
 
 def get_row(char: str) -> int:
-    return KEY_ROW.get(char.lower(), 2)
+    o = ord(char)
+    return _ROW_ARR[o] if o < 128 else KEY_ROW.get(char.lower(), 2)
 
 
 def same_hand(f1: int, f2: int) -> bool:
@@ -629,6 +1067,14 @@ def row_distance(r1: int, r2: int) -> int:
     return abs(r1 - r2)
 
 
+# same_hand / row_distance for every finger (0-8) and row (0-4) pair, so the
+# per-keystroke path indexes a table instead of calling a function.
+_SAME_HAND = tuple(tuple(same_hand(_i, _j) for _j in range(9)) for _i in range(9))
+_ROW_DIST = tuple(tuple(row_distance(_i, _j) for _j in range(5)) for _i in range(5))
+# FINGER_HOLD ** 0.3, the finger scaling of the same-key repeat penalty
+_SAME_KEY_FINGER_MULT = tuple(_h ** 0.3 for _h in _FINGER_HOLD_ARR)
+
+
 # Issue #17: bigram speeds regenerated per-round via function
 _FAST_BIGRAMS = [
     'th', 'he', 'in', 'er', 'an', 'on', 'en', 'at', 'ou', 'ed',
@@ -643,26 +1089,43 @@ _SLOW_BIGRAMS = [
 ]
 
 
-def _generate_bigram_speeds() -> dict:
-    """Generate randomized bigram speed multipliers. Called per-round."""
-    speeds = {}
-    for pair in _FAST_BIGRAMS:
-        speeds[pair] = random.uniform(0.55, 0.80)
-    for pair in _SLOW_BIGRAMS:
-        speeds[pair] = random.uniform(1.25, 1.80)
-    return speeds
+_BIGRAMS = _FAST_BIGRAMS + _SLOW_BIGRAMS
+# (ord(a) << 7) | ord(b) for each entry of _BIGRAMS, matching _SFP_MAT
+_BIGRAM_CODES = tuple((ord(_bg[0]) << 7) | ord(_bg[1]) for _bg in _BIGRAMS)
+
+
+def _generate_bigram_speeds() -> tuple:
+    """Generate randomized bigram speed multipliers. Called per-round.
+
+    Draws all unit variates in one batch and scales them per group, then
+    fills both the dict and the flat 128x128 table (indexed like _SFP_MAT,
+    0.0 = no entry) from that one list.  Returns ``(speeds, matrix)``.
+    """
+    rand = random.random
+    n_fast = len(_FAST_BIGRAMS)
+    values = [0.55 + 0.25 * rand() for _ in range(n_fast)]
+    values += [1.25 + 0.55 * rand() for _ in range(len(_SLOW_BIGRAMS))]
+    mat = [0.0] * (128 * 128)
+    for code, speed in zip(_BIGRAM_CODES, values):
+        mat[code] = speed
+    return dict(zip(_BIGRAMS, values)), mat
 
 
 # Same-finger bigrams (precomputed, constant)
-SAME_FINGER_PAIRS: set = set()
-for _keys, _finger in [
-    ('qaz', 0), ('wsx', 1), ('edc', 2), ('rfvtgb', 3),
-    ('yhnujm', 4), ('ik,', 5), ('ol.', 6), ("p;/'-=[]\\", 7),
-]:
-    for _a in _keys:
-        for _b in _keys:
-            if _a != _b:
-                SAME_FINGER_PAIRS.add(_a + _b)
+SAME_FINGER_PAIRS: frozenset = frozenset(
+    _a + _b
+    for _keys, _finger in [
+        ('qaz', 0), ('wsx', 1), ('edc', 2), ('rfvtgb', 3),
+        ('yhnujm', 4), ('ik,', 5), ('ol.', 6), ("p;/'-=[]\\", 7),
+    ]
+    for _a in _keys for _b in _keys if _a != _b
+)
+
+# SAME_FINGER_PAIRS as a flat 128x128 adjacency matrix indexed by
+# (ord(a) << 7) | ord(b): one byte load instead of a str slice + set hash.
+_SFP_MAT = bytearray(128 * 128)
+for _pair in SAME_FINGER_PAIRS:
+    _SFP_MAT[(ord(_pair[0]) << 7) | ord(_pair[1])] = 1
 
 # Adjacent keys for typos
 ADJACENT_KEYS = {
@@ -675,14 +1138,16 @@ ADJACENT_KEYS = {
 }
 
 # Issue #8: common short words typed as motor chunks
-MOTOR_CHUNKS = {
+MOTOR_CHUNKS = frozenset({
     'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had',
     'her', 'was', 'one', 'our', 'out', 'has', 'his', 'how', 'its', 'may',
     'new', 'now', 'old', 'see', 'way', 'who', 'did', 'get', 'let', 'say',
     'she', 'too', 'use', 'is', 'it', 'he', 'we', 'do', 'no', 'so', 'up',
     'if', 'my', 'as', 'at', 'be', 'by', 'go', 'in', 'me', 'of', 'on',
     'or', 'to', 'a', 'i',
-}
+})
+# Longest chunk; longer words skip the lowercase + hash membership test
+_MAX_CHUNK_LEN = max(map(len, MOTOR_CHUNKS))
 
 # Letter frequency for word difficulty scoring (Issue #10)
 _LETTER_FREQ = {
@@ -693,29 +1158,42 @@ _LETTER_FREQ = {
 }
 
 
+# Per-char rarity contribution indexed by ASCII code (Issue #10 weights).
+_LETTER_RARITY = [max(0, (5.0 - _LETTER_FREQ.get(chr(_c), 0.5))) * 0.02
+                  for _c in range(128)]
+
+
 def word_difficulty(word: str) -> float:
     """Score word difficulty 0.0 (trivial) to 1.0+ (very hard).
 
     Issue #10: considers letter frequency, length, rare bigrams.
     """
-    if not word:
+    return _word_difficulty_cached(word.lower())
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_difficulty_cached(lower: str) -> float:
+    """Memoized word_difficulty body; expects an already-lowercased word.
+
+    MonkeyType word lists are a few hundred common words, so after the first
+    round nearly every lookup is a cache hit.
+    """
+    if not lower:
         return 0.0
+    # Work on ASCII byte codes; anything else becomes '?', which scores the
+    # same (default frequency, never part of a same-finger pair).
+    codes = lower.encode("ascii", "replace")
+
     # Length factor
-    length_score = max(0, (len(word) - 3)) * 0.08
+    length_score = max(0, (len(codes) - 3)) * 0.08
 
     # Letter rarity
-    rarity = 0.0
-    for ch in word.lower():
-        freq = _LETTER_FREQ.get(ch, 0.5)
-        rarity += max(0, (5.0 - freq)) * 0.02
+    rarity = sum(map(_LETTER_RARITY.__getitem__, codes))
 
     # Rare bigrams
-    bigram_score = 0.0
-    lower = word.lower()
-    for j in range(len(lower) - 1):
-        bg = lower[j:j+2]
-        if bg in SAME_FINGER_PAIRS:
-            bigram_score += 0.08
+    sfp = _SFP_MAT
+    bigram_score = 0.08 * sum([sfp[(a << 7) | b]
+                               for a, b in zip(codes, codes[1:])])
 
     return min(2.0, length_score + rarity + bigram_score)
 
@@ -725,51 +1203,67 @@ def word_difficulty(word: str) -> float:
 # ===========================================================================
 
 def kogasa(cov: float) -> float:
-    """MonkeyType's exact consistency formula."""
-    return 100 * (1 - math.tanh(cov + cov**3 / 3 + cov**5 / 5))
+    """MonkeyType's exact consistency formula.
 
+    cov + cov^3/3 + cov^5/5, evaluated in Horner form (no float pow calls).
+    """
+    c2 = cov * cov
+    return 100 * (1 - math.tanh(cov * (1 + c2 * (1 / 3 + c2 / 5))))
 
-def compute_consistency(values: list) -> float:
-    """Compute kogasa consistency from an array of values."""
-    if len(values) < 2:
-        return 100.0
-    avg = sum(values) / len(values)
-    if avg == 0:
+
+def consistency_from_moments(n: int, mean: float, m2: float) -> float:
+    """Kogasa consistency from running Welford moments (count, mean, M2).
+
+    The population coefficient of variation is sqrt(M2 / n) / mean, so no
+    samples need to be kept.
+    """
+    if n < 2 or mean == 0:
         return 100.0
-    sd = (sum((x - avg) ** 2 for x in values) / len(values)) ** 0.5
-    return kogasa(sd / avg)
+    return kogasa(math.sqrt(max(0.0, m2 / n)) / mean)
 
 
 def target_cov_for_consistency(target_consistency: float) -> float:
-    """Inverse kogasa via binary search."""
-    lo, hi = 0.0, 5.0
-    for _ in range(100):
-        mid = (lo + hi) / 2
-        if kogasa(mid) > target_consistency:
-            lo = mid
-        else:
-            hi = mid
-    return (lo + hi) / 2
+    """Inverse kogasa, clamped to [0, 5].
+
+    kogasa(cov) = 100 * (1 - tanh(g(cov))) with g(x) = x + x^3/3 + x^5/5, so
+    cov solves g(x) = atanh(1 - target/100).  g is increasing and convex
+    for x >= 0 and g(x) >= x, so Newton's method started at x = y converges
+    monotonically from above in a few steps.
+    """
+    frac = 1 - target_consistency / 100
+    if frac <= 0:
+        return 0.0
+    if frac >= 1:
+        return 5.0
+    y = math.atanh(frac)
+    x = min(y, 5.0)
+    for _ in range(8):
+        x2 = x * x
+        x -= (x + x * x2 / 3 + x * x2 * x2 / 5 - y) / (1 + x2 + x2 * x2)
+    return min(max(x, 0.0), 5.0)
 
 
 # ===========================================================================
 #  Ex-Gaussian Distribution  (Issue #5)
 # ===========================================================================
 
-def exgaussian(mu: float, sigma: float, tau: float) -> float:
-    """Sample from an ex-Gaussian distribution (Gaussian + Exponential).
+def exgaussian_innovations(n: int, sigma_frac: float,
+                           tau_frac: float) -> list:
+    """Draw n unit ex-Gaussian innovations in one batch.
 
-    This is the empirically validated model for human keystroke inter-key
-    intervals. Parameters:
-        mu    - Gaussian mean (core typing speed)
-        sigma - Gaussian SD (motor noise)
-        tau   - Exponential mean (cognitive/attentional pauses)
-
-    The result is always positive and right-skewed, matching real typing data.
+    The ex-Gaussian (Gaussian + Exponential) is the empirically validated
+    model for human inter-key intervals: a sample with Gaussian mean base,
+    minus base, is sigma*z + tau*e with z ~ N(0,1) and e ~ Exp(1).  With
+    sigma and tau proportional to base, each sample is base * (sigma_frac*z
+    + tau_frac*e), so the unit part can be drawn ahead of time and scaled
+    by the per-char base later.
     """
-    gauss_part = random.gauss(mu, sigma)
-    expo_part = random.expovariate(1.0 / tau) if tau > 0 else 0.0
-    return gauss_part + expo_part
+    gauss = random.gauss
+    expo = random.expovariate
+    if tau_frac > 0:
+        return [sigma_frac * gauss(0.0, 1.0) + tau_frac * expo(1.0)
+                for _ in range(n)]
+    return [sigma_frac * gauss(0.0, 1.0) for _ in range(n)]
 
 
 # ===========================================================================
@@ -793,8 +1287,8 @@ class HumanProfile:
         # Speed-dependent correction: at higher WPMs, word-start pauses and
         # space gaps take proportionally more of the budget.  The correction
         # ranges from ~0.88 at low WPM to ~0.74 at very high WPM.
-        # CDP overhead compensation (calibrate_cdp_overhead) handles the
-        # infrastructure latency separately.
+        # CDP latency needs no compensation here: KeyClock deadlines
+        # absorb it.
         raw_iki = 60.0 / (target_wpm * 6)
         speed_ratio = min(2.0, target_wpm / REFERENCE_WPM)  # REFERENCE_WPM=110
         # Correction factor: balances speed-up effects (motor chunks, hand
@@ -829,6 +1323,9 @@ class HumanProfile:
         speed_factor = max(0.5, min(2.0, target_wpm / REFERENCE_WPM))
         self.exgauss_sigma = self.base_delay * random.uniform(0.08, 0.15)
         self.exgauss_tau = self.base_delay * random.uniform(0.05, 0.12)
+        # Per-unit-of-base fractions (noise is scaled by the per-char base)
+        self.exgauss_sigma_frac = self.exgauss_sigma / self.base_delay
+        self.exgauss_tau_frac = self.exgauss_tau / self.base_delay
 
         # --- Mistake rates (scale with speed) ---
         # Base rates are per-character trigger probabilities, modulated by
@@ -901,7 +1398,7 @@ class HumanProfile:
         self.difficulty_pause_scale = random.uniform(0.3, 0.8)
 
         # --- Issue #17: bigram speeds regenerated per profile ---
-        self.bigram_speeds = _generate_bigram_speeds()
+        self.bigram_speeds, self.bigram_speed_mat = _generate_bigram_speeds()
 
 
 def safe_sleep(seconds: float):
@@ -914,6 +1411,18 @@ def safe_sleep(seconds: float):
 #  Issues #5, #6, #7, #8, #9, #15, #16
 # ===========================================================================
 
+def _fold_code(char: str) -> int:
+    """ASCII code of char with A-Z folded to lowercase; -1 if not ASCII."""
+    o = ord(char)
+    if 0x41 <= o <= 0x5a:
+        return o | 0x20
+    return o if o < 0x80 else -1
+
+
+# Keystrokes covered by the precomputed rhythm table (~11 min at 150 WPM)
+_RHYTHM_TABLE_LEN = 8192
+
+
 class KeystrokeDynamicsEngine:
     """Generates keystroke timing that passes MonkeyType's anti-cheat analysis.
 
@@ -936,141 +1445,250 @@ class KeystrokeDynamicsEngine:
 
     def __init__(self, profile: HumanProfile, total_words: int = 100):
         self.profile = profile
+        self._flow_table: list[float] = []
         self.total_words = total_words
-        self.key_spacings: list[float] = []
-        self.key_durations: list[float] = []
-        self.prev_char: str | None = None
+        # Per-word warmup (smooth part, noise added per keystroke) and fatigue
+        self._warmup_table = [
+            profile.warmup_slowdown
+            - (profile.warmup_slowdown - 1.0) * (w / profile.warmup_words)
+            for w in range(profile.warmup_words)
+        ]
+        onset = profile.fatigue_onset_words
+        self._fatigue_table = [
+            1.0 + (profile.fatigue_max - 1.0) * min(1.0, max(0, w - onset) / 60)
+            for w in range(onset + 61)
+        ]
+        # Per-run scalars hoisted out of compute_delay
+        self._max_delay = profile.base_delay * 2.0
+        self._rhythm_step = (2 * math.pi / profile.rhythm_period
+                             if profile.rhythm_period > 0 else 0.0)
+        # Rhythm multiplier per keystroke index; the period is not an integer,
+        # so this is a plain prefix table, not a ring (sin() past its end)
+        self._rhythm_table = [
+            1.0 + profile.rhythm_amplitude * math.sin(self._rhythm_step * k)
+            for k in range(_RHYTHM_TABLE_LEN)
+        ] if self._rhythm_step else []
+        # Issue #9: log-normal hold parameters (mu, sigma) per finger, and
+        # for the space bar; compute_hold() then only draws
+        self._hold_ln = []
+        for finger_mult in _FINGER_HOLD_ARR:
+            base_hold = profile.hold_mean * finger_mult
+            sigma_ln = profile.hold_sigma / base_hold
+            self._hold_ln.append(
+                (math.log(base_hold) - 0.5 * sigma_ln ** 2, max(0.05, sigma_ln)))
+        space_base = profile.hold_mean * _FINGER_HOLD_ARR[get_finger(' ')]
+        self._space_hold_ln = (math.log(profile.hold_mean * 0.80),
+                               max(0.05, profile.hold_sigma * 0.5 / space_base))
+        # Streaming Welford moments (count, mean, M2) for the report
+        self._sp_n, self._sp_mean, self._sp_m2 = 0, 0.0, 0.0
+        self._du_n, self._du_mean, self._du_m2 = 0, 0.0, 0.0
+        self._prev_char: str | None = None
+        self._prev_code = -1  # _fold_code(prev_char), kept in step with it
         self.prev_finger: int | None = None
         self.prev_row: int | None = None
         self.word_count = 0
         self.char_in_word = 0
         self.total_chars = 0
         self._current_word_len = 0   # Issue #3E: initialized properly
-        self._current_word = ""
+        self._current_word_lower = ""
+        self._is_chunk = False
+        self._current_word_diff = 0.0
+        self.word_difficulties: list[float] = []
         self._ar1_residual = 0.0     # Issue #6: AR(1) state
         self._last_delay = None      # Issue #7: for spacing-duration correlation
+        self._innovations: list[float] = []   # pre-drawn ex-Gaussian noise
+        self._innov_idx = 0
+        self._refill_innovations()
+
+    @property
+    def prev_char(self) -> str | None:
+        return self._prev_char
+
+    @prev_char.setter
+    def prev_char(self, char: str | None):
+        self._prev_char = char
+        self._prev_code = _fold_code(char) if char else -1
+
+    @property
+    def total_words(self) -> int:
+        return self._total_words
+
+    @total_words.setter
+    def total_words(self, n: int):
+        """Set the test length and rebuild the per-word flow curve table."""
+        self._total_words = n
+        self._flow_table = [self._flow_factor(w / max(1, n))
+                            for w in range(n + 1)] if n > 0 else []
+
+    def _flow_factor(self, test_progress: float) -> float:
+        """Sigmoid flow x end-of-test deceleration multiplier (Issue #16)."""
+        p = self.profile
+        # Sigmoid: slow start -> fast middle -> slow end
+        # Using logistic-like shape
+        sigmoid = 1.0 / (1.0 + math.exp(-12 * (test_progress - 0.25)))
+        end_decel = 1.0 + (p.flow_decel - 1.0) * max(0, (test_progress - 0.85)) / 0.15
+        flow_mult = 1.0 - (1.0 - p.flow_accel) * sigmoid
+        return flow_mult * end_decel
+
+    def _refill_innovations(self):
+        """Pre-draw unit ex-Gaussian innovations for the rest of the round."""
+        p = self.profile
+        n = max(256, self.total_words * 8)
+        self._innovations = exgaussian_innovations(
+            n, p.exgauss_sigma_frac, p.exgauss_tau_frac)
+        self._innov_idx = 0
 
     def compute_delay(self, char: str) -> float:
         """Compute inter-key delay with all anatomical, cognitive, and
         statistical realism features."""
         p = self.profile
         base = p.base_delay
+        rand = random.random
 
-        finger = get_finger(char)
-        row = get_row(char)
+        # Inlined get_finger/get_row table lookups for the ASCII case
+        code = ord(char)
+        if code < 128:
+            finger, row = _FINGER_ARR[code], _ROW_ARR[code]
+        else:
+            finger, row = get_finger(char), get_row(char)
 
         # 1. Finger speed
-        base *= FINGER_SPEED.get(finger, 1.0)
+        base *= _FINGER_SPEED_ARR[finger]
 
         # 2. Row distance penalty
-        if self.prev_row is not None:
-            dist = row_distance(self.prev_row, row)
+        prev_row, prev_finger = self.prev_row, self.prev_finger
+        if prev_row is not None:
+            dist = _ROW_DIST[prev_row][row]
             if dist > 0:
-                base *= 1.0 + dist * random.uniform(0.06, 0.14)
+                base *= 1.0 + dist * (0.06 + 0.08 * rand())
 
         # 3-7. Finger/key relationship penalties (mutually exclusive,
         #       most-specific wins to avoid compounding).
-        is_same_key = (self.prev_char and self.prev_char.lower() == char.lower())
-        bigram = (self.prev_char + char).lower() if self.prev_char else ""
-        is_same_finger_bigram = bigram in SAME_FINGER_PAIRS
-        is_same_finger = (self.prev_finger is not None
-                          and finger == self.prev_finger and finger != 8)
+        is_same_key = False
+        is_same_finger_bigram = False
+        bg_speed = 0.0
+        # Case-folded char code (-1 = non-ASCII); the previous one is carried
+        # over in _prev_code, so ASCII bigrams need no str allocations
+        o = code | 0x20 if 0x41 <= code <= 0x5a else (code if code < 0x80 else -1)
+        prev_char = self._prev_char
+        if prev_char:
+            po = self._prev_code
+            if o >= 0 and po >= 0:
+                pair = (po << 7) | o
+                is_same_key = o == po
+                is_same_finger_bigram = _SFP_MAT[pair]
+                bg_speed = p.bigram_speed_mat[pair]
+            else:
+                bigram = (prev_char + char).lower()
+                is_same_key = prev_char.lower() == char.lower()
+                is_same_finger_bigram = bigram in SAME_FINGER_PAIRS
+                bg_speed = p.bigram_speeds.get(bigram, 0.0)
+        is_same_finger = finger == prev_finger and finger != 8
 
         if is_same_key:
             # 7. Same key repeat — strongest penalty (subsumes same-finger)
-            finger_mult = FINGER_HOLD.get(finger, 1.0)
-            base *= random.uniform(1.25, 1.45) * (finger_mult ** 0.3)
+            base *= (1.25 + 0.2 * rand()) * _SAME_KEY_FINGER_MULT[finger]
         elif is_same_finger_bigram:
             # 6b. Same-finger bigram pair (subsumes generic same-finger)
-            base *= random.uniform(1.18, 1.38)
+            base *= 1.18 + 0.2 * rand()
         elif is_same_finger:
             # 3. Generic same-finger penalty
-            base *= random.uniform(1.12, 1.30)
-        elif (self.prev_finger is not None
-              and not same_hand(finger, self.prev_finger)):
-            # 4. Hand alternation bonus
-            base *= random.uniform(0.85, 0.95)
-        elif (self.prev_finger is not None
-              and same_hand(finger, self.prev_finger)):
-            # 5. Same hand, different finger
-            base *= random.uniform(0.96, 1.08)
+            base *= 1.12 + 0.18 * rand()
+        elif prev_finger is not None:
+            if not _SAME_HAND[finger][prev_finger]:
+                # 4. Hand alternation bonus
+                base *= 0.85 + 0.1 * rand()
+            else:
+                # 5. Same hand, different finger
+                base *= 0.96 + 0.12 * rand()
 
         # 6a. Bigram-specific speed (Issue #17: per-occurrence noise)
         #     Applied independently — this is a speed lookup, not a penalty.
-        if self.prev_char:
-            bg_speed = p.bigram_speeds.get(bigram)
-            if bg_speed is not None:
-                base *= bg_speed * random.uniform(0.93, 1.07)
+        if bg_speed:
+            base *= bg_speed * (0.93 + 0.14 * rand())
 
         # 8. Word start: cognitive pause + word difficulty (Issue #10)
         if self.char_in_word == 0:
-            base *= random.uniform(*p.word_start_extra)
+            lo, hi = p.word_start_extra
+            base *= lo + (hi - lo) * rand()
             # Difficulty-aware pause for upcoming word
-            diff = word_difficulty(self._current_word)
-            base *= 1.0 + diff * p.difficulty_pause_scale * random.uniform(0.3, 0.7)
+            diff = self._current_word_diff
+            base *= 1.0 + diff * p.difficulty_pause_scale * (0.3 + 0.4 * rand())
 
         # 9. Warm-up with noise (Issue #8E: stochastic warmup)
-        if self.word_count < p.warmup_words:
-            warmup_progress = self.word_count / p.warmup_words
-            smooth = p.warmup_slowdown - (p.warmup_slowdown - 1.0) * warmup_progress
+        wc = self.word_count
+        if wc < p.warmup_words:
             noise = random.gauss(0, 0.08)  # stochastic jumps
-            base *= max(1.0, smooth + noise)
+            base *= max(1.0, self._warmup_table[wc] + noise)
 
-        # 10. Fatigue
-        if self.word_count > p.fatigue_onset_words:
-            fatigue_progress = min(1.0, (self.word_count - p.fatigue_onset_words) / 60)
-            base *= 1.0 + (p.fatigue_max - 1.0) * fatigue_progress
+        # 10. Fatigue (saturates 60 words after onset)
+        if wc > p.fatigue_onset_words:
+            fatigue = self._fatigue_table
+            base *= fatigue[wc] if wc < len(fatigue) else fatigue[-1]
 
         # 11. Motor chunking (Issue #8: common words as single units)
-        if self._current_word.lower() in MOTOR_CHUNKS and self.char_in_word > 0:
+        if self.char_in_word > 0 and self._is_chunk:
             base *= p.chunk_speedup
         elif self._current_word_len <= p.burst_max_len:
             base *= p.burst_speedup
 
-        # 12. Sigmoid speed curve across test (Issue #16)
-        if self.total_words > 0:
-            test_progress = self.word_count / max(1, self.total_words)
-            # Sigmoid: slow start -> fast middle -> slow end
-            # Using logistic-like shape
-            sigmoid = 1.0 / (1.0 + math.exp(-12 * (test_progress - 0.25)))
-            end_decel = 1.0 + (p.flow_decel - 1.0) * max(0, (test_progress - 0.85)) / 0.15
-            flow_mult = 1.0 - (1.0 - p.flow_accel) * sigmoid
-            base *= flow_mult * end_decel
+        # 12. Sigmoid speed curve across test (Issue #16), tabulated per word
+        if self._total_words > 0:
+            if wc < len(self._flow_table):
+                base *= self._flow_table[wc]
+            else:
+                base *= self._flow_factor(wc / self._total_words)
 
         # 13. Rhythmic periodicity (Issue #15: sinusoidal modulation)
-        if p.rhythm_period > 0:
-            phase = 2 * math.pi * self.total_chars / p.rhythm_period
-            base *= 1.0 + p.rhythm_amplitude * math.sin(phase)
-
-        # 14. Ex-Gaussian sampling (Issue #5: replaces discrete mixture)
-        # Scale noise relative to current base, not profile base_delay,
-        # so CoV stays stable regardless of per-character multipliers.
-        sigma = base * (p.exgauss_sigma / p.base_delay)
-        tau = base * (p.exgauss_tau / p.base_delay)
-        delay = exgaussian(base, sigma, tau)
-
-        # 15. AR(1) serial autocorrelation (Issue #6)
-        innovation = delay - base
-        self._ar1_residual = p.ar1_phi * self._ar1_residual + innovation
-        delay = base + self._ar1_residual
-
-        # Clamp: never exceed 2.0x base_delay (prevents outlier spikes
-        # that destroy consistency)
-        delay = max(MIN_SLEEP, min(delay, p.base_delay * 2.0))
+        if self._rhythm_step:
+            k = self.total_chars
+            if k < _RHYTHM_TABLE_LEN:
+                base *= self._rhythm_table[k]
+            else:
+                base *= 1.0 + p.rhythm_amplitude * math.sin(self._rhythm_step * k)
+
+        # 14-15. Ex-Gaussian innovation (Issue #5) fed straight into the
+        # AR(1) residual (Issue #6): xi_t = phi*xi_{t-1} + base*(sf*z + tf*e).
+        # Noise scales with the current base, not profile base_delay, so CoV
+        # stays stable regardless of per-character multipliers; the unit
+        # innovations are pre-drawn per round; the delay is base + xi_t,
+        # clamped below.
+        idx = self._innov_idx
+        if idx >= len(self._innovations):
+            self._refill_innovations()
+            idx = 0
+        self._innov_idx = idx + 1
+        residual = p.ar1_phi * self._ar1_residual + base * self._innovations[idx]
+        self._ar1_residual = residual
+        delay = base + residual
+        # Clamp: never exceed 2.0x base_delay (prevents outlier spikes that
+        # destroy consistency)
+        max_delay = self._max_delay
+        if delay > max_delay:
+            delay = max_delay
+        elif delay < MIN_SLEEP:
+            delay = MIN_SLEEP
 
         # Record for consistency tracking
-        self.key_spacings.append(delay * 1000)  # ms
+        x = delay * 1000  # ms
+        n = self._sp_n + 1
+        d = x - self._sp_mean
+        self._sp_mean += d / n
+        self._sp_m2 += d * (x - self._sp_mean)
+        self._sp_n = n
         self._last_delay = delay
 
         # Update state
-        self.prev_char = char
+        self._prev_char = char
+        self._prev_code = o
         self.prev_finger = finger
         self.prev_row = row
         self.char_in_word += 1
         self.total_chars += 1
 
-        log.debug("char='%s' finger=%d row=%d delay=%.1fms",
-                  char, finger, row, delay * 1000)
+        if _DEBUG_KEYS:
+            log.debug("char='%s' finger=%d row=%d delay=%.1fms",
+                      char, finger, row, delay * 1000)
 
         return delay
 
@@ -1081,28 +1699,26 @@ class KeystrokeDynamicsEngine:
         Issue #9:  Log-normal distribution for realistic right-skewed shape.
         """
         p = self.profile
-        finger = get_finger(char)
-
-        # Base hold with finger modifier
-        finger_mult = FINGER_HOLD.get(finger, 1.0)
-        base_hold = p.hold_mean * finger_mult
+        rand = random.random
+        code = ord(char)
+        if code < 128:
+            finger, row = _FINGER_ARR[code], _ROW_ARR[code]
+        else:
+            finger, row = get_finger(char), get_row(char)
 
         # Issue #9: log-normal distribution (right-skewed, always positive)
-        mu_ln = math.log(base_hold) - 0.5 * (p.hold_sigma / base_hold) ** 2
-        sigma_ln = p.hold_sigma / base_hold
-        hold = random.lognormvariate(mu_ln, max(0.05, sigma_ln))
+        # around the finger's base hold
+        hold = random.lognormvariate(*self._hold_ln[finger])
 
         # Home row bonus / number row penalty
-        row = get_row(char)
         if row == 2:
-            hold *= random.uniform(0.88, 0.97)
+            hold *= 0.88 + 0.09 * rand()
         elif row == 0:
-            hold *= random.uniform(1.05, 1.20)
+            hold *= 1.05 + 0.15 * rand()
 
         # Space bar: consistent, shorter
         if char == ' ':
-            hold = random.lognormvariate(
-                math.log(p.hold_mean * 0.80), max(0.05, p.hold_sigma * 0.5 / base_hold))
+            hold = random.lognormvariate(*self._space_hold_ln)
 
         # Issue #7: correlate with spacing (faster typing = shorter holds)
         if self._last_delay is not None:
@@ -1112,30 +1728,64 @@ class KeystrokeDynamicsEngine:
         hold = max(p.hold_min, min(hold, p.hold_max))
 
         # Record
-        self.key_durations.append(hold * 1000)  # ms
+        x = hold * 1000  # ms
+        n = self._du_n + 1
+        d = x - self._du_mean
+        self._du_mean += d / n
+        self._du_m2 += d * (x - self._du_mean)
+        self._du_n = n
 
         return hold
 
+    def compute_timings(self, text: str) -> list:
+        """(delay, hold) for each char of text, computed in one pass.
+
+        Same draws and state updates as alternating compute_delay() and
+        compute_hold() per char.
+        """
+        delay_fn, hold_fn = self.compute_delay, self.compute_hold
+        return [(delay_fn(c), hold_fn(c)) for c in text]
+
     def should_overlap(self) -> bool:
         return random.random() < self.profile.overlap_chance
 
     def overlap_duration(self) -> float:
-        return random.uniform(*self.profile.overlap_time)
+        lo, hi = self.profile.overlap_time
+        return lo + (hi - lo) * random.random()
+
+    def correction_pause(self) -> float:
+        lo, hi = self.profile.correction_react
+        return lo + (hi - lo) * random.random()
 
     def word_boundary(self):
         self.char_in_word = 0
         self.word_count += 1
 
-    def set_word_context(self, word: str):
-        """Set context for the current word."""
-        self._current_word = word
+    def add_words(self, words: list):
+        """Score upcoming words once, up front (Issue #10 difficulty)."""
+        self.word_difficulties.extend([word_difficulty(w) for w in words])
+
+    def set_word_context(self, word: str, word_index: int | None = None):
+        """Set context for the current word.
+
+        Uses the difficulty precomputed by add_words() when word_index is
+        known, and resolves motor-chunk membership once per word, so the
+        typing loop does no scoring work.
+        """
         self._current_word_len = len(word)
+        self._current_word_lower = word.lower()
+        self._is_chunk = (self._current_word_len <= _MAX_CHUNK_LEN
+                          and self._current_word_lower in MOTOR_CHUNKS)
+        if word_index is not None and word_index < len(self.word_difficulties):
+            self._current_word_diff = self.word_difficulties[word_index]
+        else:
+            self._current_word_diff = _word_difficulty_cached(self._current_word_lower)
 
     def get_consistency_report(self) -> dict:
-        spacing_cons = (compute_consistency(self.key_spacings)
-                        if self.key_spacings else 0)
-        duration_cons = (compute_consistency(self.key_durations)
-                         if self.key_durations else 0)
+        spacing_cons = (consistency_from_moments(
+            self._sp_n, self._sp_mean, self._sp_m2) if self._sp_n else 0)
+        duration_cons = (consistency_from_moments(
+            self._du_n, self._du_mean, self._du_m2) if self._du_n else 0)
         return {
             "keyConsistency": round(spacing_cons, 2),
             "holdConsistency": round(duration_cons, 2),
@@ -1247,6 +1897,18 @@ COMMON_TYPOS = {
     'while': ['whiel', 'whlie', 'whil', 'hwile'],
 }
 
+
+def _common_typos_for(word: str) -> list | None:
+    """COMMON_TYPOS entry for word, case-insensitively (keys are lowercase).
+
+    MonkeyType words are almost always lowercase already, so lower() (a new
+    string) is only called for words with uppercase letters.
+    """
+    typos = COMMON_TYPOS.get(word)
+    if typos is None and not word.islower():
+        typos = COMMON_TYPOS.get(word.lower())
+    return typos
+
 CONFUSION_PAIRS = {
     'b': 'v', 'v': 'b', 'n': 'm', 'm': 'n',
     'd': 'f', 'f': 'd', 'g': 'h', 'h': 'g',
@@ -1254,6 +1916,26 @@ CONFUSION_PAIRS = {
     'c': 'x', 'x': 'c',
 }
 
+# ADJACENT_KEYS / CONFUSION_PAIRS keyed by the exact char, uppercase letters
+# included (with upper-cased typos), so the typo pickers skip the lower() /
+# isupper() / upper() calls
+_ADJACENT_BY_CHAR = dict(ADJACENT_KEYS)
+_ADJACENT_BY_CHAR.update({k.upper(): v.upper() for k, v in ADJACENT_KEYS.items()
+                          if k.upper() != k})
+_CONFUSION_BY_CHAR = dict(CONFUSION_PAIRS)
+_CONFUSION_BY_CHAR.update({k.upper(): v.upper()
+                           for k, v in CONFUSION_PAIRS.items()})
+
+# Issue #14: error-rate multiplier by position in word (near-zero on first
+# char, peak at 3-5); positions past the end use 1.0
+_ERR_POS_MULT = (0.05, 0.5, 0.5, 1.5, 1.5, 1.5)
+# Error-rate multiplier by [finger][row]: pinky keys x1.5, number row x1.8
+_ERR_KEY_MULT = tuple(
+    tuple((1.5 if _f in (0, 7) else 1.0) * (1.8 if _r == 0 else 1.0)
+          for _r in range(5))
+    for _f in range(9)
+)
+
 
 class ErrorEngine:
     """Context-aware error generation with position weighting and delayed detection.
@@ -1264,6 +1946,10 @@ class ErrorEngine:
 
     def __init__(self, profile: HumanProfile):
         self.profile = profile
+        # Error-type CDF, built once since the profile weights are fixed
+        weights = profile.error_weights
+        self._error_types = tuple(weights)
+        self._error_cum = list(itertools.accumulate(weights.values()))
 
     def should_make_error(self, char: str, char_index: int, word: str,
                           word_index: int, prev_char: str | None = None) -> bool:
@@ -1273,27 +1959,17 @@ class ErrorEngine:
         peak at positions 3-5, declining after).
         """
         p = self.profile
-        base_chance = p.typo_chance
-
-        # Issue #14: position weighting within word
-        # Near-zero on first char, peak at 3-5, declining after
-        if char_index == 0:
-            base_chance *= 0.05  # almost never error on first char
-        elif char_index <= 2:
-            base_chance *= 0.5
-        elif char_index <= 5:
-            base_chance *= 1.5   # peak error zone
+        code = ord(char)
+        if code < 128:
+            finger, row = _FINGER_ARR[code], _ROW_ARR[code]
         else:
-            base_chance *= 1.0
+            finger, row = get_finger(char), get_row(char)
 
-        # Pinky keys: higher error rate
-        finger = get_finger(char)
-        if finger in (0, 7):
-            base_chance *= 1.5
-
-        # Number row: higher error rate
-        if get_row(char) == 0:
-            base_chance *= 1.8
+        # Issue #14: position weighting within word, then pinky and
+        # number-row penalties, all from precomputed tables
+        base_chance = p.typo_chance * _ERR_KEY_MULT[finger][row]
+        if char_index < len(_ERR_POS_MULT):
+            base_chance *= _ERR_POS_MULT[char_index]
 
         # Long words: increase mid-word
         if len(word) > 6 and char_index > 3:
@@ -1306,9 +1982,8 @@ class ErrorEngine:
         # Issue #14 addition: difficult transitions increase error rate
         if prev_char:
             pf = get_finger(prev_char)
-            pr = get_row(prev_char)
             # Same finger, different row = hard transition
-            if pf == finger and pf != 8 and pr != get_row(char):
+            if pf == finger and pf != 8 and get_row(prev_char) != row:
                 base_chance *= 1.6
 
         return random.random() < base_chance
@@ -1319,39 +1994,29 @@ class ErrorEngine:
         # Reduced at high WPM because it's very expensive (type wrong word +
         # backspace all + retype correct word) and fast typists rarely make
         # whole-word substitutions.
-        if char_index == 0 and word.lower() in COMMON_TYPOS:
+        if char_index == 0 and _common_typos_for(word):
             wpm = self.profile.target_wpm
             common_typo_rate = 0.06 if wpm <= 100 else max(0.01, 0.06 - 0.001 * (wpm - 100))
             if random.random() < common_typo_rate:
                 return "common_typo"
 
-        # Use profile's error type weights (normalized to probabilities)
-        weights = self.profile.error_weights
-        types = list(weights.keys())
-        vals = list(weights.values())
-        total = sum(vals)
-        # Cumulative distribution
-        r = random.random() * total
-        cumulative = 0.0
-        for t, w in zip(types, vals):
-            cumulative += w
-            if r < cumulative:
-                return t
-        return types[-1]  # fallback
+        # Use profile's error type weights: bisect the cumulative sums
+        cum = self._error_cum
+        idx = bisect.bisect_right(cum, random.random() * cum[-1])
+        return self._error_types[min(idx, len(self._error_types) - 1)]
 
     def get_adjacent_typo(self, char: str) -> str:
-        if char.lower() in ADJACENT_KEYS:
-            neighbors = ADJACENT_KEYS[char.lower()]
-            wrong = random.choice(neighbors)
-            return wrong.upper() if char.isupper() else wrong
+        neighbors = _ADJACENT_BY_CHAR.get(char)
+        if neighbors is not None:
+            return random.choice(neighbors)
         # Fallback: pick a random nearby lowercase letter
         fallback = 'abcdefghijklmnopqrstuvwxyz'
         return random.choice(fallback)
 
     def get_confusion_typo(self, char: str) -> str:
-        if char.lower() in CONFUSION_PAIRS:
-            wrong = CONFUSION_PAIRS[char.lower()]
-            return wrong.upper() if char.isupper() else wrong
+        wrong = _CONFUSION_BY_CHAR.get(char)
+        if wrong is not None:
+            return wrong
         return self.get_adjacent_typo(char)
 
     def should_correct(self) -> bool:
@@ -1395,6 +2060,292 @@ def simulate_mouse_idle(driver):
 #  Issues #4, #13, #18
 # ===========================================================================
 
+class KeyClock:
+    """keyDown-to-keyDown deadline schedule for the typing loop.
+
+    The engine's delays are keyDown-to-keyDown intervals.  Sleeping until
+    the previous keyDown deadline + delay absorbs the hold, the CDP round
+    trips and any sleep overshoot, instead of subtracting estimates of them
+    and letting the error accumulate.  A key that is already late gets the
+    MIN_SLEEP gap and re-anchors the schedule (no catch-up burst).
+    """
+    __slots__ = ("last_down",)
+
+    def __init__(self):
+        self.last_down = time.perf_counter()
+
+    def wait(self, delay: float):
+        """Sleep until delay after the previous keyDown; that is the new one.
+
+        Uses _precise_sleep like the hold timings, so on coarse-timer
+        platforms the keyDown lands on the deadline rather than the next
+        OS tick after it.
+        """
+        target = self.last_down + delay
+        now = time.perf_counter()
+        if target - now < MIN_SLEEP:
+            target = now + MIN_SLEEP
+        _precise_sleep(target - now)
+        self.last_down = target
+
+    def mark(self):
+        """Re-anchor at now, after a pause or a key sent without wait()."""
+        self.last_down = time.perf_counter()
+
+
+def _type_run(driver, engine: KeystrokeDynamicsEngine, text: str,
+              clock: KeyClock):
+    """Type a run of chars that has no error decisions in between.
+
+    Delays and holds for the whole run come from one compute_timings()
+    pass before the first key; keys go out on the clock's schedule.
+    """
+    for ch, (delay, hold) in zip(text, engine.compute_timings(text)):
+        clock.wait(delay)
+        cdp_type_char(driver, ch, hold)
+
+
+def _backspace_n(driver, engine: KeystrokeDynamicsEngine, n: int):
+    """n backspaces, each followed by the profile's backspace gap."""
+    compute_hold, rand = engine.compute_hold, random.random
+    lo, hi = engine.profile.backspace_delay
+    for _ in range(n):
+        cdp_backspace(driver, compute_hold('a'))
+        safe_sleep(lo + (hi - lo) * rand())
+
+
+def _notice_and_fix(driver, engine: KeystrokeDynamicsEngine,
+                    error_engine: ErrorEngine, word: str, i: int, span: int,
+                    clock: KeyClock) -> int:
+    """Issue #13: correct an error covering word[i:i + span].
+
+    Delayed notice may type 1-3 more chars first; then react, backspace all
+    of it (possibly one too many) and retype correctly.  Returns the index
+    after the retyped chars.
+    """
+    extra_typed = 0
+    if error_engine.should_delay_notice() and i + span < len(word):
+        extra_typed = min(error_engine.delayed_chars_count(),
+                          len(word) - i - span)
+        _type_run(driver, engine, word[i + span:i + span + extra_typed], clock)
+
+    safe_sleep(engine.correction_pause())
+    total_bs = span + extra_typed
+    if error_engine.should_over_backspace():
+        total_bs += 1
+    _backspace_n(driver, engine, total_bs)
+    # Retype correctly (one earlier char too if over-backspaced)
+    start = max(0, i - 1 if total_bs > span + extra_typed else i)
+    clock.mark()
+    _type_run(driver, engine, word[start:i + span + extra_typed], clock)
+    return i + span + extra_typed
+
+
+# ---------------------------------------------------------------------------
+#  Error handlers: (driver, engine, error_engine, overlap_state, word, i,
+#  clock) -> index to resume at, or None if the error can't apply at word[i]
+# ---------------------------------------------------------------------------
+
+def _error_common_typo(driver, engine: KeystrokeDynamicsEngine,
+                       error_engine: ErrorEngine, overlap_state: OverlapState,
+                       word: str, i: int, clock: KeyClock) -> int | None:
+    """Type a common misspelling of the whole word, then maybe retype it."""
+    if i != 0:
+        return None
+    typo_word = random.choice(_common_typos_for(word))
+    # Release any held key before error handling
+    overlap_state.release_held(driver)
+    _type_run(driver, engine, typo_word, clock)
+    if error_engine.should_correct():
+        safe_sleep(engine.correction_pause())
+        # Issue #13: possible over-backspace
+        bs_count = len(typo_word)
+        if error_engine.should_over_backspace():
+            bs_count += 1
+        # (an over-backspace has nothing before this word to retype)
+        _backspace_n(driver, engine, bs_count)
+        # Reset engine state for clean retype
+        engine.char_in_word = 0
+        clock.mark()
+        _type_run(driver, engine, word, clock)
+    return len(word)
+
+
+def _error_transpose(driver, engine: KeystrokeDynamicsEngine,
+                     error_engine: ErrorEngine, overlap_state: OverlapState,
+                     word: str, i: int, clock: KeyClock) -> int | None:
+    """Type word[i + 1] before word[i]."""
+    if i >= len(word) - 1:
+        return None
+    overlap_state.release_held(driver)
+    compute_delay, compute_hold = engine.compute_delay, engine.compute_hold
+    # Type next char first, then current (transposed)
+    delay1 = compute_delay(word[i + 1])
+    hold1 = compute_hold(word[i + 1])
+    clock.wait(delay1)
+    cdp_type_char(driver, word[i + 1], hold1)
+    delay2 = compute_delay(word[i])
+    hold2 = compute_hold(word[i])
+    clock.wait(delay2)
+    cdp_type_char(driver, word[i], hold2)
+
+    if error_engine.should_correct():
+        return _notice_and_fix(driver, engine, error_engine, word, i, 2, clock)
+    return i + 2
+
+
+def _type_wrong_key(driver, engine: KeystrokeDynamicsEngine,
+                    overlap_state: OverlapState, clock: KeyClock, wrong: str):
+    """Release any held key, then type wrong in place of word[i]."""
+    overlap_state.release_held(driver)
+    delay = engine.compute_delay(wrong)
+    hold = engine.compute_hold(wrong)
+    clock.wait(delay)
+    cdp_type_char(driver, wrong, hold)
+
+
+def _error_adjacent(driver, engine: KeystrokeDynamicsEngine,
+                    error_engine: ErrorEngine, overlap_state: OverlapState,
+                    word: str, i: int, clock: KeyClock) -> int | None:
+    """Hit a neighbouring key instead of word[i]."""
+    _type_wrong_key(driver, engine, overlap_state, clock,
+                    error_engine.get_adjacent_typo(word[i]))
+    if error_engine.should_correct():
+        return _notice_and_fix(driver, engine, error_engine, word, i, 1, clock)
+    return i + 1
+
+
+def _error_confusion(driver, engine: KeystrokeDynamicsEngine,
+                     error_engine: ErrorEngine, overlap_state: OverlapState,
+                     word: str, i: int, clock: KeyClock) -> int | None:
+    """Type a commonly confused char for word[i]; fix it right away."""
+    ch = word[i]
+    _type_wrong_key(driver, engine, overlap_state, clock,
+                    error_engine.get_confusion_typo(ch))
+    if error_engine.should_correct():
+        safe_sleep(engine.correction_pause())
+        _backspace_n(driver, engine, 1)
+        hold = engine.compute_hold(ch)
+        clock.mark()
+        cdp_type_char(driver, ch, hold)
+    return i + 1
+
+
+def _error_double_tap(driver, engine: KeystrokeDynamicsEngine,
+                      error_engine: ErrorEngine, overlap_state: OverlapState,
+                      word: str, i: int, clock: KeyClock) -> int | None:
+    """Type word[i] twice in quick succession."""
+    ch = word[i]
+    compute_hold = engine.compute_hold
+    overlap_state.release_held(driver)
+    delay = engine.compute_delay(ch)
+    hold = compute_hold(ch)
+    clock.wait(delay)
+    cdp_type_char(driver, ch, hold)
+    # Accidental second tap (finger-dependent gap)
+    finger_mult = FINGER_HOLD.get(get_finger(ch), 1.0)
+    gap = max(MIN_SLEEP, random.gauss(
+        engine.profile.base_delay * 0.25 * finger_mult, 0.015))
+    safe_sleep(gap)
+    hold2 = compute_hold(ch)
+    clock.mark()
+    cdp_type_char(driver, ch, hold2)
+    if error_engine.should_correct():
+        safe_sleep(engine.correction_pause())
+        cdp_backspace(driver, compute_hold('a'))
+        clock.mark()
+    return i + 1
+
+
+def _error_skip(driver, engine: KeystrokeDynamicsEngine,
+                error_engine: ErrorEngine, overlap_state: OverlapState,
+                word: str, i: int, clock: KeyClock) -> int | None:
+    """Leave out word[i] (engine state moves on as if it was typed)."""
+    ch = word[i]
+    engine.prev_char = ch
+    engine.prev_finger = get_finger(ch)
+    engine.prev_row = get_row(ch)
+    engine.char_in_word += 1
+    return i + 1
+
+
+# ErrorEngine.get_error_type() result -> handler
+_ERROR_HANDLERS = {
+    "common_typo": _error_common_typo,
+    "transpose":   _error_transpose,
+    "adjacent":    _error_adjacent,
+    "confusion":   _error_confusion,
+    "double_tap":  _error_double_tap,
+    "skip":        _error_skip,
+}
+
+
+def _clean_stretch(engine: KeystrokeDynamicsEngine, error_engine: ErrorEngine,
+                   word: str, i: int, word_index: int) -> tuple:
+    """Roll the error checks ahead from word[i] until one fires.
+
+    The checks only depend on the intended previous char, so they can run
+    before any key is sent.  Returns (end, fired): word[i:end] is
+    error-free, and fired says whether the check for word[end] triggered.
+    """
+    should_make_error = error_engine.should_make_error
+    j = i
+    prev_ch = engine.prev_char
+    while j < len(word) and not should_make_error(
+            word[j], j, word, word_index, prev_char=prev_ch):
+        prev_ch = word[j]
+        j += 1
+    return j, j < len(word)
+
+
+def _end_word(driver, engine: KeystrokeDynamicsEngine, clock: KeyClock,
+              is_last_word: bool):
+    """The space after a word plus an occasional thinking pause.
+
+    Issue #4: no space after the last word.
+    """
+    if is_last_word:
+        return
+    profile = engine.profile
+    # Space IKI: scale by space_gap_range, from the last keyDown
+    rand = random.random
+    lo, hi = profile.space_gap_range
+    clock.wait(profile.base_delay * (lo + (hi - lo) * rand()))
+    space_hold = engine.compute_hold(' ')
+    cdp_type_char(driver, ' ', space_hold)
+
+    # Occasional thinking pause
+    if rand() < profile.think_pause_chance:
+        lo, hi = profile.think_pause_range
+        safe_sleep(profile.base_delay * (lo + (hi - lo) * rand()))
+
+
+def _type_word_fast(driver, word: str, engine: KeystrokeDynamicsEngine,
+                    overlap_state: OverlapState, timings: list,
+                    clock: KeyClock, is_last_word: bool):
+    """type_word_advanced for a word whose error checks all passed.
+
+    Only the normal-keystroke path: the precomputed (delay, hold) pairs,
+    Issue #18 rollover and the trailing space.
+    """
+    should_overlap = engine.should_overlap
+    overlap_duration = engine.overlap_duration
+    type_with_overlap = overlap_state.type_with_overlap
+    type_normal = overlap_state.type_normal
+    for i, (delay, hold) in enumerate(timings):
+        # compute_timings() already set engine.prev_char for this word.
+        # One straight-line sequence for both cases: a rollover only brings
+        # the keyDown forward by ov_time and picks the other typing call.
+        do_overlap = should_overlap() and i > 0
+        ov_time = overlap_duration() if do_overlap else 0.0
+        clock.wait(delay - ov_time)
+        (type_with_overlap if do_overlap else type_normal)(
+            driver, word[i], hold, ov_time)
+
+    overlap_state.release_held(driver)
+    _end_word(driver, engine, clock, is_last_word)
+
+
 def type_word_advanced(driver, word: str, engine: KeystrokeDynamicsEngine,
                        error_engine: ErrorEngine, word_index: int,
                        is_last_word: bool, overlap_state: OverlapState):
@@ -1404,272 +2355,84 @@ def type_word_advanced(driver, word: str, engine: KeystrokeDynamicsEngine,
     Issue #13: Delayed error detection.
     Issue #18: True key overlap via OverlapState.
     """
-    chars = list(word)
     engine.word_boundary()
-    engine.set_word_context(word)
+    engine.set_word_context(word, word_index)
+    # delay = desired keyDown-to-keyDown interval, scheduled from the
+    # previous keyDown (or from now, after a pause)
+    clock = KeyClock()
+    # word[clean_start:clean_end] passed its error checks and has its
+    # (delay, hold) pairs precomputed in `timings`; error_pending means the
+    # check for word[clean_end] already fired.
+    clean_start = 0
+    clean_end, error_pending = _clean_stretch(engine, error_engine, word,
+                                              0, word_index)
+    timings = engine.compute_timings(word[:clean_end])
+    if not error_pending:
+        # Most words: every check passed, so take the error-free path
+        _type_word_fast(driver, word, engine, overlap_state, timings, clock,
+                        is_last_word)
+        return
+
+    compute_delay, compute_hold = engine.compute_delay, engine.compute_hold
     i = 0
-    # Track previous hold so we can subtract it from the IKI budget.
-    # delay = desired keyDown-to-keyDown interval; prev_hold was already
-    # slept inside cdp_type_char, so the pre-key sleep = delay - prev_hold.
-    prev_hold = 0.0
 
-    while i < len(chars):
-        ch = chars[i]
+    while i < len(word):
+        ch = word[i]
 
         # --- Check for errors ---
-        prev_ch = engine.prev_char
-        if error_engine.should_make_error(ch, i, word, word_index,
-                                          prev_char=prev_ch):
+        # Rolled ahead over the whole error-free stretch from i, whose
+        # timings are then computed in one pass.
+        if i >= clean_end and not error_pending:
+            clean_start = i
+            clean_end, error_pending = _clean_stretch(
+                engine, error_engine, word, i, word_index)
+            timings = engine.compute_timings(word[i:clean_end])
+        if i == clean_end and error_pending:
+            error_pending = False
             error_type = error_engine.get_error_type(ch, i, word)
+            # Handlers return the index to resume at, or None when the error
+            # does not apply here and the char is typed normally
 
-            if error_type == "common_typo" and i == 0:
-                typo_word = random.choice(COMMON_TYPOS[word.lower()])
-                # Release any held key before error handling
-                overlap_state.release_held(driver)
-                prev_hold = 0.0
-                for tc in typo_word:
-                    delay = engine.compute_delay(tc)
-                    hold = engine.compute_hold(tc)
-                    safe_sleep(max(MIN_SLEEP, delay - prev_hold))
-                    cdp_type_char(driver, tc, hold)
-                    prev_hold = hold
-                if error_engine.should_correct():
-                    safe_sleep(random.uniform(*engine.profile.correction_react))
-                    prev_hold = 0.0
-                    # Issue #13: possible over-backspace
-                    bs_count = len(typo_word)
-                    if error_engine.should_over_backspace():
-                        bs_count += 1
-                    for _ in range(bs_count):
-                        h = engine.compute_hold('a')
-                        cdp_backspace(driver, h)
-                        safe_sleep(random.uniform(*engine.profile.backspace_delay))
-                    # If over-backspaced, retype the deleted char from before
-                    if bs_count > len(typo_word):
-                        # we deleted one char too many; nothing before this word though
-                        pass
-                    # Reset engine state for clean retype
-                    engine.char_in_word = 0
-                    prev_hold = 0.0
-                    for cc in chars:
-                        delay = engine.compute_delay(cc)
-                        hold = engine.compute_hold(cc)
-                        safe_sleep(max(MIN_SLEEP, delay - prev_hold))
-                        cdp_type_char(driver, cc, hold)
-                        prev_hold = hold
-                i = len(chars)
-                continue
-
-            elif error_type == "transpose" and i < len(chars) - 1:
-                overlap_state.release_held(driver)
-                # Type next char first, then current (transposed)
-                delay1 = engine.compute_delay(chars[i + 1])
-                hold1 = engine.compute_hold(chars[i + 1])
-                safe_sleep(max(MIN_SLEEP, delay1 - prev_hold))
-                cdp_type_char(driver, chars[i + 1], hold1)
-                delay2 = engine.compute_delay(chars[i])
-                hold2 = engine.compute_hold(chars[i])
-                safe_sleep(max(MIN_SLEEP, delay2 - hold1))
-                cdp_type_char(driver, chars[i], hold2)
-                prev_hold = hold2
-
-                if error_engine.should_correct():
-                    # Issue #13: delayed notice — might type 1-2 more chars first
-                    extra_typed = 0
-                    if error_engine.should_delay_notice() and i + 2 < len(chars):
-                        n_extra = min(error_engine.delayed_chars_count(),
-                                      len(chars) - i - 2)
-                        for k in range(n_extra):
-                            ci = i + 2 + k
-                            d = engine.compute_delay(chars[ci])
-                            h = engine.compute_hold(chars[ci])
-                            safe_sleep(max(MIN_SLEEP, d - prev_hold))
-                            cdp_type_char(driver, chars[ci], h)
-                            prev_hold = h
-                            extra_typed += 1
-
-                    safe_sleep(random.uniform(*engine.profile.correction_react))
-                    prev_hold = 0.0
-                    # Backspace all: extra + 2 transposed chars
-                    total_bs = 2 + extra_typed
-                    if error_engine.should_over_backspace():
-                        total_bs += 1
-                    for _ in range(total_bs):
-                        h = engine.compute_hold('a')
-                        cdp_backspace(driver, h)
-                        safe_sleep(random.uniform(*engine.profile.backspace_delay))
-                    # Retype correctly
-                    prev_hold = 0.0
-                    start = i - 1 if total_bs > 2 + extra_typed else i
-                    start = max(0, start)
-                    for ci in range(start, i + 2 + extra_typed):
-                        if ci < len(chars):
-                            d = engine.compute_delay(chars[ci])
-                            h = engine.compute_hold(chars[ci])
-                            safe_sleep(max(MIN_SLEEP, d - prev_hold))
-                            cdp_type_char(driver, chars[ci], h)
-                            prev_hold = h
-                    i = i + 2 + extra_typed
-                else:
-                    i += 2
-                continue
-
-            elif error_type == "adjacent":
-                overlap_state.release_held(driver)
-                wrong = error_engine.get_adjacent_typo(ch)
-                delay = engine.compute_delay(wrong)
-                hold = engine.compute_hold(wrong)
-                safe_sleep(max(MIN_SLEEP, delay - prev_hold))
-                cdp_type_char(driver, wrong, hold)
-                prev_hold = hold
-
-                if error_engine.should_correct():
-                    extra_typed = 0
-                    # Issue #13: delayed notice
-                    if error_engine.should_delay_notice() and i + 1 < len(chars):
-                        n_extra = min(error_engine.delayed_chars_count(),
-                                      len(chars) - i - 1)
-                        for k in range(n_extra):
-                            ci = i + 1 + k
-                            d = engine.compute_delay(chars[ci])
-                            h = engine.compute_hold(chars[ci])
-                            safe_sleep(max(MIN_SLEEP, d - prev_hold))
-                            cdp_type_char(driver, chars[ci], h)
-                            prev_hold = h
-                            extra_typed += 1
-
-                    safe_sleep(random.uniform(*engine.profile.correction_react))
-                    prev_hold = 0.0
-                    total_bs = 1 + extra_typed
-                    if error_engine.should_over_backspace():
-                        total_bs += 1
-                    for _ in range(total_bs):
-                        h = engine.compute_hold('a')
-                        cdp_backspace(driver, h)
-                        safe_sleep(random.uniform(*engine.profile.backspace_delay))
-                    # Retype correct chars
-                    prev_hold = 0.0
-                    start = i - 1 if total_bs > 1 + extra_typed else i
-                    start = max(0, start)
-                    for ci in range(start, i + 1 + extra_typed):
-                        if ci < len(chars):
-                            d = engine.compute_delay(chars[ci])
-                            h = engine.compute_hold(chars[ci])
-                            safe_sleep(max(MIN_SLEEP, d - prev_hold))
-                            cdp_type_char(driver, chars[ci], h)
-                            prev_hold = h
-                    i = i + 1 + extra_typed
-                else:
-                    i += 1
-                continue
-
-            elif error_type == "confusion":
-                overlap_state.release_held(driver)
-                wrong = error_engine.get_confusion_typo(ch)
-                delay = engine.compute_delay(wrong)
-                hold = engine.compute_hold(wrong)
-                safe_sleep(max(MIN_SLEEP, delay - prev_hold))
-                cdp_type_char(driver, wrong, hold)
-                if error_engine.should_correct():
-                    safe_sleep(random.uniform(*engine.profile.correction_react))
-                    h = engine.compute_hold('a')
-                    cdp_backspace(driver, h)
-                    safe_sleep(random.uniform(*engine.profile.backspace_delay))
-                    hold = engine.compute_hold(ch)
-                    cdp_type_char(driver, ch, hold)
-                    prev_hold = hold
-                else:
-                    prev_hold = hold
-                i += 1
-                continue
-
-            elif error_type == "double_tap":
-                overlap_state.release_held(driver)
-                delay = engine.compute_delay(ch)
-                hold = engine.compute_hold(ch)
-                safe_sleep(max(MIN_SLEEP, delay - prev_hold))
-                cdp_type_char(driver, ch, hold)
-                # Accidental second tap (finger-dependent gap)
-                finger_mult = FINGER_HOLD.get(get_finger(ch), 1.0)
-                gap = max(MIN_SLEEP,
-                          random.gauss(engine.profile.base_delay * 0.25 * finger_mult, 0.015))
-                safe_sleep(gap)
-                hold2 = engine.compute_hold(ch)
-                cdp_type_char(driver, ch, hold2)
-                if error_engine.should_correct():
-                    safe_sleep(random.uniform(*engine.profile.correction_react))
-                    cdp_backspace(driver, engine.compute_hold('a'))
-                    prev_hold = 0.0
-                else:
-                    prev_hold = hold2
-                i += 1
-                continue
-
-            elif error_type == "skip":
-                # Skip this character (update engine state properly)
-                engine.prev_char = ch
-                engine.prev_finger = get_finger(ch)
-                engine.prev_row = get_row(ch)
-                engine.char_in_word += 1
-                i += 1
+            next_i = _ERROR_HANDLERS[error_type](
+                driver, engine, error_engine, overlap_state, word, i, clock)
+            if next_i is not None:
+                i = next_i
                 continue
 
         # --- Normal keystroke ---
-        delay = engine.compute_delay(ch)
-        hold = engine.compute_hold(ch)
-
-        # Subtract previous hold + CDP overhead from the IKI budget.
-        # Each cdp_type_char does 2 CDP calls (keyDown + keyUp), and the
-        # previous char's CDP overhead was not accounted for in prev_hold.
-        cdp_cost = 2 * CDP_OVERHEAD
-        iki_sleep = max(MIN_SLEEP, delay - prev_hold - cdp_cost)
-
-        # Issue #18: true key overlap (rollover)
-        if engine.should_overlap() and engine.prev_char and i > 0:
-            ov_time = engine.overlap_duration()
-            effective_delay = max(MIN_SLEEP, iki_sleep - ov_time)
-            safe_sleep(effective_delay)
-            overlap_state.type_with_overlap(driver, ch, hold, ov_time)
+        if i < clean_end:
+            delay, hold = timings[i - clean_start]
         else:
-            safe_sleep(iki_sleep)
-            # Release any previously held key before normal typing
-            overlap_state.release_held(driver)
-            cdp_type_char(driver, ch, hold)
+            # Error roll fired but no branch applied to this position
+            delay = compute_delay(ch)
+            hold = compute_hold(ch)
+
+        # Issue #18: true key overlap (rollover) brings the keyDown forward
+        do_overlap = engine.should_overlap() and engine.prev_char and i > 0
+        ov_time = engine.overlap_duration() if do_overlap else 0.0
+        clock.wait(delay - ov_time)
+        # type_normal releases any previously held key first
+        (overlap_state.type_with_overlap if do_overlap
+         else overlap_state.type_normal)(driver, ch, hold, ov_time)
 
-        prev_hold = hold
         i += 1
 
     # Release any held key before space
     overlap_state.release_held(driver)
-
-    # Issue #4: No space after the last word
-    if not is_last_word:
-        # Space IKI: scale by space_gap_range, subtract prev hold + CDP cost
-        space_delay = engine.profile.base_delay * random.uniform(
-            *engine.profile.space_gap_range)
-        safe_sleep(max(MIN_SLEEP, space_delay - prev_hold - 2 * CDP_OVERHEAD))
-        space_hold = engine.compute_hold(' ')
-        cdp_type_char(driver, ' ', space_hold)
-
-        # Occasional thinking pause
-        if random.random() < engine.profile.think_pause_chance:
-            think = engine.profile.base_delay * random.uniform(
-                *engine.profile.think_pause_range)
-            safe_sleep(think)
+    _end_word(driver, engine, clock, is_last_word)
 
 
 # ===========================================================================
 #  Browser Management
 # ===========================================================================
 
-def find_chrome_binary() -> str | None:
-    system = platform.system()
-    candidates = []
-    if system == "Windows":
+def _chrome_install_paths() -> tuple:
+    """Fixed install locations of Chromium-based browsers on this OS."""
+    if _PLATFORM == "Windows":
         local = os.environ.get("LOCALAPPDATA", "")
         pf = os.environ.get("PROGRAMFILES", "C:\\Program Files")
         pf86 = os.environ.get("PROGRAMFILES(X86)", "C:\\Program Files (x86)")
-        candidates = [
+        return (
             os.path.join(pf, "Google", "Chrome", "Application", "chrome.exe"),
             os.path.join(pf86, "Google", "Chrome", "Application", "chrome.exe"),
             os.path.join(local, "Google", "Chrome", "Application", "chrome.exe"),
@@ -1677,28 +2440,32 @@ def find_chrome_binary() -> str | None:
             os.path.join(local, "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
             os.path.join(pf, "Microsoft", "Edge", "Application", "msedge.exe"),
             os.path.join(pf86, "Microsoft", "Edge", "Application", "msedge.exe"),
-        ]
-    elif system == "Darwin":
-        candidates = [
+        )
+    if _PLATFORM == "Darwin":
+        return (
             "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
             "/Applications/Chromium.app/Contents/MacOS/Chromium",
             "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
             "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
-        ]
+        )
+    return ()
+
 
-    for name in [
-        "google-chrome-stable", "google-chrome", "chromium-browser",
-        "chromium", "brave-browser", "brave", "microsoft-edge-stable",
-        "microsoft-edge",
-    ]:
-        found = shutil.which(name)
-        if found:
-            candidates.insert(0, found)
+_CHROME_INSTALL_PATHS = _chrome_install_paths()
+_CHROME_NAMES = (
+    "google-chrome-stable", "google-chrome", "chromium-browser",
+    "chromium", "brave-browser", "brave", "microsoft-edge-stable",
+    "microsoft-edge",
+)
 
-    for path in candidates:
-        if os.path.isfile(path):
-            return path
-    return None
+
+@functools.lru_cache(maxsize=1)
+def find_chrome_binary() -> str | None:
+    # Browsers on PATH win over fixed install paths; among them the later
+    # names in _CHROME_NAMES take precedence
+    on_path = (shutil.which(name) for name in reversed(_CHROME_NAMES))
+    return next((path for path in itertools.chain(on_path, _CHROME_INSTALL_PATHS)
+                 if path and os.path.isfile(path)), None)
 
 
 # Realistic user-agent strings (Issue #11)
@@ -1720,13 +2487,11 @@ def launch_browser():
     The user's existing Chrome must be CLOSED for option 2, because Chrome
     locks the profile directory (SingletonLock).
     """
-    DEBUGGER_ADDRESS = "127.0.0.1:9222"
     CHROME_USER_DATA = os.path.expanduser("~/.config/google-chrome")
     CHROME_PROFILE = "Profile 3"  # "Abdullah Farooqi" profile
 
     # --- Try attaching to running Chrome first ---
     try:
-        import urllib.request
         resp = urllib.request.urlopen(f"http://{DEBUGGER_ADDRESS}/json/version",
                                       timeout=2)
         resp.close()
@@ -1801,10 +2566,9 @@ def launch_browser():
         else:
             print(f"\nERROR: Could not launch Chrome.\n{e}")
             print("\nMake sure Google Chrome is installed.")
-            system = platform.system()
-            if system == "Windows":
+            if _PLATFORM == "Windows":
                 print("Download: https://www.google.com/chrome/")
-            elif system == "Darwin":
+            elif _PLATFORM == "Darwin":
                 print("  brew install --cask google-chrome")
             else:
                 print("  sudo apt install google-chrome-stable  (Debian/Ubuntu)")
@@ -1842,38 +2606,6 @@ def _verify_stealth(driver):
         log.debug("Stealth verification failed: %s", exc)
 
 
-def calibrate_cdp_overhead(driver, n: int = 20):
-    """Measure average CDP call overhead by sending benign events.
-
-    This lets us subtract the infrastructure latency from our sleep times
-    so the actual inter-key intervals match the intended timing.
-    """
-    global CDP_OVERHEAD
-    import time as _time
-    times = []
-    for _ in range(n):
-        t0 = _time.perf_counter()
-        try:
-            driver.execute_cdp_cmd("Input.dispatchKeyEvent", {
-                "type": "keyUp",
-                "key": "",
-                "code": "",
-                "windowsVirtualKeyCode": 0,
-                "nativeVirtualKeyCode": 0,
-            })
-        except Exception:
-            pass
-        times.append(_time.perf_counter() - t0)
-
-    if times:
-        # Use median to avoid outlier spikes
-        times.sort()
-        median = times[len(times) // 2]
-        CDP_OVERHEAD = median
-        log.debug("CDP overhead calibrated: %.1fms (median of %d samples)",
-                  median * 1000, n)
-
-
 # ===========================================================================
 #  MonkeyType Page Interaction
 #  Issues #3, #20
@@ -1910,10 +2642,17 @@ def dismiss_popups(driver):
                 '.cc-btn.cc-dismiss',         // Cookie Consent plugin
                 '.qc-cmp2-summary-buttons button:first-child',
             ];
+            // One DOM pass for all of them, then the first match of each
+            // selector in priority order; click it if visible
+            var found = document.querySelectorAll(selectors.join(','));
+            pick:
             for (var s of selectors) {
-                var el = document.querySelector(s);
-                if (el && el.offsetParent !== null) {
-                    el.click();
+                for (var el of found) {
+                    if (!el.matches(s)) continue;
+                    if (el.offsetParent !== null) {
+                        el.click();
+                        break pick;
+                    }
                     break;
                 }
             }
@@ -1925,6 +2664,21 @@ def dismiss_popups(driver):
         log.debug("Popup dismissal failed: %s", exc)
 
 
+_FOCUSED_JS = """
+    var words = document.getElementById('words');
+    return !!(words && !words.classList.contains('blurred'));
+"""
+
+
+def is_typing_focused(driver) -> bool:
+    """Whether the words are focused (read over the DevTools socket if open)."""
+    try:
+        return bool(_eval_js(driver, _FOCUSED_JS))
+    except Exception as exc:
+        log.debug("Focus check failed: %s", exc)
+        return False
+
+
 def focus_typing_area(driver):
     """Focus the typing area via CDP mouse click + JS fallback."""
     try:
@@ -1956,114 +2710,310 @@ def focus_typing_area(driver):
     time.sleep(0.2)
 
 
-def is_typing_focused(driver) -> bool:
-    try:
-        return driver.execute_script("""
-            var words = document.getElementById('words');
-            return words && !words.classList.contains('blurred');
-        """) or False
-    except Exception as exc:
-        log.debug("Focus check failed: %s", exc)
-        return False
-
-
-def is_test_ready(driver) -> bool:
-    try:
-        return driver.execute_script("""
-            var words = document.getElementById('words');
-            if (!words) return false;
-            var result = document.getElementById('result');
-            if (result && !result.classList.contains('hidden')) return false;
-            var wordEls = words.querySelectorAll('.word');
-            if (wordEls.length === 0) return false;
-            var active = words.querySelector('.word.active');
-            if (!active) return false;
-            var typed = words.querySelectorAll('.word.typed');
-            if (typed.length > 0) return false;
-            var correctOrIncorrect = active.querySelectorAll(
-                'letter.correct, letter.incorrect');
-            if (correctOrIncorrect.length > 0) return false;
-            return true;
-        """) or False
-    except Exception as exc:
-        log.debug("Test ready check failed: %s", exc)
-        return False
+_FINISHED_JS = """
+    var result = document.getElementById('result');
+    return result && !result.classList.contains('hidden');
+"""
 
 
 def is_test_finished(driver) -> bool:
     try:
-        return driver.execute_script("""
-            var result = document.getElementById('result');
-            return result && !result.classList.contains('hidden');
-        """) or False
+        return _run_probe(driver, "finished") or False
     except Exception as exc:
         log.debug("Test finished check failed: %s", exc)
         return False
 
 
+_TEST_MODE_JS = """
+    var modeEl = document.querySelector('#testConfig .mode .textButton.active');
+    var mode = modeEl ? modeEl.getAttribute('mode') : 'unknown';
+    var detail = '';
+    if (mode === 'time') {
+        var timeEl = document.querySelector(
+            '#testConfig .time .textButton.active');
+        detail = timeEl ? timeEl.getAttribute('timeConfig') : '';
+    } else if (mode === 'words') {
+        var wordEl = document.querySelector(
+            '#testConfig .wordCount .textButton.active');
+        detail = wordEl ? wordEl.getAttribute('wordCount') : '';
+    }
+    return {mode: mode, detail: detail};
+"""
+
+
 def detect_test_mode(driver) -> dict:
     """Detect the current MonkeyType test mode and settings."""
     try:
-        result = driver.execute_script("""
-            var modeEl = document.querySelector('#testConfig .mode .textButton.active');
-            var mode = modeEl ? modeEl.getAttribute('mode') : 'unknown';
-            var detail = '';
-            if (mode === 'time') {
-                var timeEl = document.querySelector(
-                    '#testConfig .time .textButton.active');
-                detail = timeEl ? timeEl.getAttribute('timeConfig') : '';
-            } else if (mode === 'words') {
-                var wordEl = document.querySelector(
-                    '#testConfig .wordCount .textButton.active');
-                detail = wordEl ? wordEl.getAttribute('wordCount') : '';
-            }
-            return {mode: mode, detail: detail};
-        """)
+        result = _run_probe(driver, "mode")
         return result if result else {"mode": "unknown", "detail": ""}
     except Exception as exc:
         log.debug("Mode detection failed: %s", exc)
         return {"mode": "unknown", "detail": ""}
 
 
-def get_all_words(driver) -> list | None:
-    """Read all currently visible words from the DOM."""
-    try:
-        return driver.execute_script("""
-            var words = document.querySelectorAll('#words .word');
-            if (!words.length) return null;
-            return Array.from(words).map(function(w) {
-                return Array.from(w.querySelectorAll('letter'))
-                    .map(function(l) { return l.textContent; }).join('');
+# A fresh test: words shown, none typed yet and the results hidden
+_TEST_READY_JS = """
+    var words = document.getElementById('words');
+    var result = document.getElementById('result');
+    if (!words || (result && !result.classList.contains('hidden'))) {
+        return false;
+    }
+    var active = words.querySelector('.word.active');
+    return !!active && !words.querySelector('.word.typed')
+        && !active.querySelector('letter.correct, letter.incorrect');
+"""
+
+_POLL_STATE_JS = """
+    var result = document.getElementById('result');
+    var finished = !!(result && !result.classList.contains('hidden'));
+    var ready = (function() {%s})();
+    var newWords = [];
+    if (arguments[0] === null) {
+        newWords = window.__newWords || [];
+        window.__newWords = [];
+    } else {
+        var words = document.getElementById('words');
+        var wordEls = words ? words.querySelectorAll('.word') : [];
+        for (var i = arguments[0]; i < wordEls.length; i++) {
+            newWords.push(Array.from(wordEls[i].querySelectorAll('letter'))
+                .map(function(l) { return l.textContent; }).join(''));
+        }
+    }
+    return {ready: ready, finished: finished, new_words: newWords};
+""" % _TEST_READY_JS
+
+_EMPTY_STATE = {"ready": False, "finished": False, "new_words": []}
+
+# Queue the text of every .word added under #words into window.__newWords,
+# starting with any past the arguments[0] words already read
+_WATCH_WORDS_JS = """
+    var words = document.getElementById('words');
+    if (!words) return false;
+    var text = function(w) {
+        return Array.from(w.querySelectorAll('letter'))
+            .map(function(l) { return l.textContent; }).join('');
+    };
+    window.__newWords = Array.from(words.querySelectorAll('.word'))
+        .slice(arguments[0]).map(text);
+    if (window.__wordObserver) window.__wordObserver.disconnect();
+    window.__wordObserver = new MutationObserver(function(records) {
+        records.forEach(function(r) {
+            r.addedNodes.forEach(function(n) {
+                if (!n.classList) return;
+                if (n.classList.contains('word')) {
+                    window.__newWords.push(text(n));
+                } else {
+                    n.querySelectorAll('.word').forEach(function(w) {
+                        window.__newWords.push(text(w));
+                    });
+                }
             });
-        """)
+        });
+    });
+    window.__wordObserver.observe(words, {childList: true, subtree: true});
+    return true;
+"""
+
+
+def watch_new_words(driver, known: int) -> bool:
+    """Issue #3: have the page queue words as MonkeyType loads them.
+
+    A MutationObserver on #words collects each added word, so later
+    _poll_state(driver) calls just drain a ready-made list instead of
+    re-scanning the DOM.  known is how many words have been read already.
+    """
+    try:
+        return bool(_eval_js(driver, _WATCH_WORDS_JS, known))
+    except Exception as exc:
+        log.debug("Word observer install failed: %s", exc)
+        return False
+
+
+def _wait_until_js(condition: str) -> str:
+    """Function body: a promise that resolves true once the JS expression
+    condition holds (re-checked on every DOM change), or false after
+    arguments[0] ms."""
+    return """
+    var timeoutMs = arguments[0];
+    var check = function() { return !!(%s); };
+    return new Promise(function(resolve) {
+        if (check()) return resolve(true);
+        var observer, timer;
+        var done = function(value) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(value);
+        };
+        observer = new MutationObserver(function() {
+            if (check()) done(true);
+        });
+        observer.observe(document.body, {childList: true, subtree: true,
+                                         attributes: true,
+                                         attributeFilter: ['class']});
+        timer = setTimeout(function() { done(false); }, timeoutMs);
+    });
+""" % condition
+
+
+# A ready test; checks only that, not the full _POLL_STATE_JS read
+_WAIT_READY_JS = ("var ready = function() {%s};" % _TEST_READY_JS
+                  + _wait_until_js("ready()"))
+# Words queued by watch_new_words(), or the end of the test
+_WAIT_WORDS_JS = ("var finished = function() {%s};" % _FINISHED_JS
+                  + _wait_until_js("(window.__newWords"
+                                   " && window.__newWords.length)"
+                                   " || finished()"))
+
+
+def _await_page(script: str, timeout: float) -> bool | None:
+    """Block on a _wait_until_js() script over the DevTools socket.
+
+    One Runtime.evaluate awaits the page-side promise, so the page wakes
+    us instead of being polled.  Returns its result, or None when the
+    socket is closed or the call fails (dropping the socket if it timed out
+    or is closed).
+    """
+    sock = _CDP_SOCKET
+    if sock is None:
+        return None
+    try:
+        result = sock.call("Runtime.evaluate", {
+            "expression": _js_call_expr(script, (int(timeout * 1000),)),
+            "awaitPromise": True, "returnByValue": True,
+        }, timeout=timeout + 2)
+    except RuntimeError as exc:
+        log.debug("Page wait failed: %s", exc)
+        return None
     except Exception as exc:
-        log.debug("Word reading failed: %s", exc)
+        log.debug("DevTools socket wait failed: %s", exc)
+        _drop_cdp_socket(sock)
         return None
+    if "exceptionDetails" in result:
+        log.debug("Page wait threw: %s", result["exceptionDetails"].get("text"))
+        return None
+    return bool(result["result"].get("value"))
+
+
+def wait_for_test_ready(driver, timeout: float = 5.0) -> bool:
+    """Block until the page shows a ready test, or about timeout seconds.
+
+    With the DevTools socket open this returns as soon as the test is ready
+    (see _await_page) instead of on the next POLL_INTERVAL tick.  Otherwise
+    it waits POLL_INTERVAL (or until shutdown).  Returns whether the test
+    became ready.
+    """
+    ready = _await_page(_WAIT_READY_JS, timeout)
+    if ready is None:
+        _shutdown.wait(POLL_INTERVAL)
+        return False
+    return ready
 
 
-def get_new_words_from(driver, start_index: int) -> list:
-    """Issue #3: Read words starting from a given index for dynamic word loading.
+def _poll_state(driver, start_index: int | None = None) -> dict:
+    """Issue #3: read test state and any new words in one round-trip.
 
-    In time mode, MonkeyType lazily loads new words as you type. This function
-    reads words from start_index onward, returning any new words that have appeared.
+    In time mode MonkeyType lazily loads new words as you type.  With
+    start_index=None new_words drains what watch_new_words() has queued;
+    otherwise it is every word from start_index on.  Returns {ready,
+    finished, new_words}; "ready" means a fresh test with nothing typed
+    yet.
     """
     try:
-        result = driver.execute_script(f"""
-            var words = document.querySelectorAll('#words .word');
-            var newWords = [];
-            for (var i = {start_index}; i < words.length; i++) {{
-                var letters = words[i].querySelectorAll('letter');
-                var text = Array.from(letters).map(function(l) {{
-                    return l.textContent;
-                }}).join('');
-                newWords.push(text);
-            }}
-            return newWords;
-        """)
-        return result if result else []
+        return _run_probe(driver, "poll", start_index) or _EMPTY_STATE
     except Exception as exc:
-        log.debug("Dynamic word fetch failed: %s", exc)
-        return []
+        log.debug("State poll failed: %s", exc)
+        return _EMPTY_STATE
+
+
+class WordPrefetcher:
+    """Issue #3: poll for newly loaded words off the typing thread.
+
+    Runs _poll_state() on a daemon thread so the DOM reads overlap with
+    typing instead of stalling it between words.  Only used while the
+    DevTools socket is open (see _cdp_send, _eval_js): its reads then share
+    that socket with the keystrokes instead of queueing behind them in
+    chromedriver.  Between reads it waits in the page (_await_page) until
+    watch_new_words() has queued words or the test ends, so words are
+    pushed rather than polled for.  Its reads never fall back to
+    execute_script; if the socket is dropped the thread exits (see
+    running), as it does when a read fails, and the caller polls inline
+    instead.
+    """
+
+    def __init__(self, driver, interval: float = 0.3):
+        self._driver = driver
+        self._interval = interval
+        self._words: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()  # keeps drained batches in page order
+        self._stop = threading.Event()
+        self.finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        # Started from the typing thread: do not share its FIFO slot and CPU
+        reset_thread_priority()
+        while not self._stop.is_set() and _CDP_SOCKET is not None:
+            woke = _await_page(_WAIT_WORDS_JS, 1.0)
+            if woke is None:
+                # No page-side wait possible: poll every interval
+                if self._stop.wait(self._interval):
+                    return
+            elif not woke:
+                continue
+            state = self._poll(None)
+            if state is _EMPTY_STATE:
+                return  # the socket read failed
+            if state["finished"]:
+                self.finished.set()
+                return
+
+    @property
+    def running(self) -> bool:
+        """False once the thread has exited (test over, or a socket read failed)."""
+        return self._thread.is_alive()
+
+    def _poll(self, driver) -> dict:
+        """Queue any new words; return the _poll_state() result.
+
+        driver is None on the prefetch thread, so the read goes over the
+        DevTools socket only (see _eval_js).
+        """
+        with self._lock:
+            state = _poll_state(driver)
+            if state["new_words"]:
+                self._words.put(state["new_words"])
+        return state
+
+    def fetch_now(self) -> list:
+        """Read the DOM on the calling thread, then take() (when running out)."""
+        self._poll(self._driver)
+        return self.take()
+
+    def take(self) -> list:
+        """All words fetched since the last call (never blocks)."""
+        words = []
+        while True:
+            try:
+                words.extend(self._words.get_nowait())
+            except queue.Empty:
+                return words
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=2)
+
+
+_RESULTS_JS = """
+    var wpm = document.querySelector('.group.wpm .bottom');
+    var acc = document.querySelector('.group.acc .bottom');
+    var con = document.querySelector('.group.flat.consistency .bottom');
+    return {
+        wpm: wpm ? wpm.textContent : null,
+        acc: acc ? acc.textContent : null,
+        consistency: con ? con.textContent : null
+    };
+"""
 
 
 def get_results(driver, timeout: int = 15) -> dict:
@@ -2072,22 +3022,51 @@ def get_results(driver, timeout: int = 15) -> dict:
         if is_test_finished(driver):
             break
     try:
-        result = driver.execute_script("""
-            var wpm = document.querySelector('.group.wpm .bottom');
-            var acc = document.querySelector('.group.acc .bottom');
-            var con = document.querySelector('.group.flat.consistency .bottom');
-            return {
-                wpm: wpm ? wpm.textContent : null,
-                acc: acc ? acc.textContent : null,
-                consistency: con ? con.textContent : null
-            };
-        """)
+        result = _run_probe(driver, "results")
         return result if result else {"wpm": None, "acc": None, "consistency": None}
     except Exception as exc:
         log.debug("Results reading failed: %s", exc)
         return {"wpm": None, "acc": None, "consistency": None}
 
 
+# Page probes by name.  install_page_hooks() defines each as a function on
+# window.__bot in every document, so _run_probe() ships a one-line call
+# instead of the whole script.
+_PAGE_PROBES = {
+    "poll": _POLL_STATE_JS,
+    "finished": _FINISHED_JS,
+    "mode": _TEST_MODE_JS,
+    "results": _RESULTS_JS,
+}
+_PAGE_HOOKS_JS = "window.__bot = {%s};" % ", ".join(
+    f"{name}: function() {{{script}}}" for name, script in _PAGE_PROBES.items())
+# Boxed so a hook's own null/false result is told apart from "no hooks"
+_HOOK_CALL_JS = """
+    var hook = window.__bot && window.__bot[arguments[0]];
+    return hook ? [hook.apply(null, Array.prototype.slice.call(arguments, 1))]
+                : null;
+"""
+
+
+def install_page_hooks(driver):
+    """Define window.__bot in this page and in every later one."""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": _PAGE_HOOKS_JS
+        })
+        _eval_js(driver, _PAGE_HOOKS_JS)
+    except Exception as exc:
+        log.debug("Page hook install failed: %s", exc)
+
+
+def _run_probe(driver, name: str, *args):
+    """Run page probe name via its window.__bot hook, else send its script."""
+    boxed = _eval_js(driver, _HOOK_CALL_JS, name, *args)
+    if isinstance(boxed, list):
+        return boxed[0]
+    return _eval_js(driver, _PAGE_PROBES[name], *args)
+
+
 def click_next_test(driver) -> bool:
     try:
         cdp_press_key(driver, SPECIAL_KEYS["Tab"], 0.05)
@@ -2101,6 +3080,86 @@ def click_next_test(driver) -> bool:
 #  Main Typing Orchestrator  (Issue #3: dynamic word loading)
 # ===========================================================================
 
+# CPUs and nice value the process started with, restored by
+# reset_thread_priority()
+if _PLATFORM == "Linux":
+    _BASE_CPUS = os.sched_getaffinity(0)
+    _BASE_NICE = os.getpriority(os.PRIO_PROCESS, 0)
+
+
+def raise_typing_priority() -> str:
+    """Best effort: real-time scheduling for the calling (typing) thread.
+
+    Linux only.  With CAP_SYS_NICE the thread gets SCHED_FIFO and is pinned
+    to one CPU, so CFS preemption and migrations stop smearing key timing;
+    otherwise it tries nice -10.  Threads it starts inherit this and should
+    call reset_thread_priority().  Returns the scheduling class achieved.
+    """
+    if _PLATFORM != "Linux":
+        return "default"
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+    except OSError:
+        pass
+    else:
+        try:
+            os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+        except OSError as exc:
+            log.debug("CPU pinning failed: %s", exc)
+        return "SCHED_FIFO"
+    try:
+        os.nice(-10)
+        return "nice -10"
+    except OSError:
+        return "default"
+
+
+def reset_thread_priority():
+    """Put the calling thread back on normal scheduling, on all CPUs."""
+    if _PLATFORM != "Linux":
+        return
+    try:
+        os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        os.sched_setaffinity(0, _BASE_CPUS)
+        os.setpriority(os.PRIO_PROCESS, 0, _BASE_NICE)
+    except OSError as exc:
+        log.debug("Thread priority reset failed: %s", exc)
+
+
+# The thread run_typing_thread() is typing on, joined by handle_exit()
+_typing_thread: threading.Thread | None = None
+
+
+def run_typing_thread(driver, words: list, profile: HumanProfile,
+                      mode: str = "unknown") -> tuple:
+    """type_all_words() on a dedicated thread at raised priority.
+
+    Only the keystroke loop runs under raise_typing_priority(); the main
+    thread's page polling and cooldowns stay on normal scheduling.  Errors
+    are re-raised here.
+    """
+    global _typing_thread
+    outcome = []
+
+    def target():
+        log.debug("Typing thread scheduling: %s", raise_typing_priority())
+        try:
+            outcome.append(type_all_words(driver, words, profile, mode=mode))
+        except BaseException as exc:
+            outcome.append(exc)
+
+    # Daemon: if it does not stop within handle_exit()'s join timeout, the
+    # process still exits
+    thread = threading.Thread(target=target, name="typing", daemon=True)
+    _typing_thread = thread
+    thread.start()
+    thread.join()
+    _typing_thread = None
+    if isinstance(outcome[0], BaseException):
+        raise outcome[0]
+    return outcome[0]
+
+
 def type_all_words(driver, words: list, profile: HumanProfile,
                    mode: str = "unknown") -> tuple:
     """Orchestrate the full typing of all words with maximum realism.
@@ -2108,10 +3167,22 @@ def type_all_words(driver, words: list, profile: HumanProfile,
     Issue #3: In time mode, continuously polls for new words as they appear.
     """
     engine = KeystrokeDynamicsEngine(profile, total_words=len(words))
+    engine.add_words(words)
     error_engine = ErrorEngine(profile)
     overlap_state = OverlapState()
+    rand = random.random
+    # Words between mouse micro-movements are geometric with p = 0.03
+    # (a 3% chance after each word); drawing each gap once leaves a single
+    # int compare per word
+    log_q = math.log(1.0 - 0.03)
 
-    # Focus with realistic mouse behavior
+    def idle_gap() -> int:
+        return 1 + int(math.log(1.0 - rand()) / log_q)
+
+    next_idle = idle_gap()
+
+    # Focus with realistic mouse behavior; retry if it has not taken once
+    # the page settled (the blurred class clears asynchronously)
     focus_typing_area(driver)
     time.sleep(random.uniform(0.2, 0.5))
     if not is_typing_focused(driver):
@@ -2121,37 +3192,67 @@ def type_all_words(driver, words: list, profile: HumanProfile,
     count = 0
     total_known = len(words)
     i = 0
+    # Time mode: let the page queue new words as they load, and fetch them /
+    # watch for the end in the background when the Selenium channel is free
+    # of input traffic
+    watching = mode == "time" and watch_new_words(driver, total_known)
+    prefetcher = (WordPrefetcher(driver)
+                  if watching and _CDP_SOCKET is not None else None)
 
-    while i < len(words):
-        is_last = (i == len(words) - 1)
-
-        # Issue #3: in time mode, check for new words when running low
-        if mode == "time" and is_last:
-            new_words = get_new_words_from(driver, total_known)
-            if new_words:
-                words.extend(new_words)
-                total_known += len(new_words)
-                engine.total_words = len(words)
-                is_last = False
-                log.debug("Loaded %d new words (total: %d)", len(new_words), len(words))
-
-        type_word_advanced(driver, words[i], engine, error_engine, i,
-                           is_last, overlap_state)
-        count += 1
-        i += 1
-
-        # Check if test ended (time mode can end mid-word)
-        if mode == "time" and i % 5 == 0:
-            if is_test_finished(driver):
+    try:
+        while i < len(words) and not _shutdown.is_set():
+            is_last = (i == len(words) - 1)
+
+            # Issue #3: in time mode, pick up new words (read the DOM right
+            # away if the last known word is next and none are in yet)
+            if mode == "time":
+                if prefetcher is None:
+                    new_words = []
+                    # One combined read: end-of-test check every 5 words,
+                    # new words whenever the last known word is next
+                    if is_last or (i and i % 5 == 0):
+                        state = _poll_state(
+                            driver, None if watching else total_known)
+                        if state["finished"]:
+                            log.debug("Test finished mid-typing at word %d", i)
+                            break
+                        new_words = state["new_words"]
+                else:
+                    new_words = prefetcher.take()
+                    if not new_words and is_last:
+                        new_words = prefetcher.fetch_now()
+                    if not (prefetcher.running or prefetcher.finished.is_set()):
+                        # DevTools socket dropped: poll inline from now on
+                        prefetcher.stop()
+                        new_words += prefetcher.take()
+                        prefetcher = None
+                if new_words:
+                    words.extend(new_words)
+                    total_known += len(new_words)
+                    engine.total_words = len(words)
+                    engine.add_words(new_words)
+                    is_last = False
+                    log.debug("Loaded %d new words (total: %d)", len(new_words), len(words))
+
+            type_word_advanced(driver, words[i], engine, error_engine, i,
+                               is_last, overlap_state)
+            count += 1
+            i += 1
+
+            # Check if test ended (time mode can end mid-word)
+            if prefetcher is not None and prefetcher.finished.is_set():
                 log.debug("Test finished mid-typing at word %d", i)
                 break
 
-        # Occasional mouse micro-movement
-        if random.random() < 0.03:
-            simulate_mouse_idle(driver)
-
-    # Make sure no keys are still held
-    overlap_state.release_held(driver)
+            # Occasional mouse micro-movement
+            if i >= next_idle:
+                simulate_mouse_idle(driver)
+                next_idle = i + idle_gap()
+    finally:
+        # Make sure no keys are still held, even when stopping early
+        overlap_state.release_held(driver)
+        if prefetcher is not None:
+            prefetcher.stop()
 
     return count, engine.get_consistency_report()
 
@@ -2160,25 +3261,49 @@ def type_all_words(driver, words: list, profile: HumanProfile,
 #  Display
 # ===========================================================================
 
-def display(data: dict, columns: list | None = None):
-    if columns is None:
-        columns = list(data.keys())
-    print()
-    widths = {}
-    for k in columns:
-        vals = data.get(k, [])
-        w = max(len(k), max((len(str(v)) for v in vals), default=0))
-        widths[k] = w + 2
-
-    header = "".join(k.ljust(widths[k]) for k in columns)
-    print(header)
-    print("-" * len(header))
-
-    row_count = len(next(iter(data.values())))
-    for idx in range(row_count):
-        row = "".join(str(data[k][idx]).ljust(widths[k]) for k in columns)
-        print(row)
-    print()
+class ResultsTable:
+    """Per-round results, printed as a padded text table.
+
+    Column widths, the header and formatted rows are kept up to date as
+    rounds are added, so printing after each round of a --loop session does
+    not re-measure and re-format the table.
+    """
+
+    def __init__(self, columns: list):
+        self.columns = columns
+        self._values: list[list[str]] = []
+        self._widths = [len(k) + 2 for k in columns]
+        self._rows: list[str] = []
+        self._header = self._format_header()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, *values):
+        """Append one round; values are in column order."""
+        cells = [str(v) for v in values]
+        self._values.append(cells)
+        widths = [max(w, len(c) + 2) for w, c in zip(self._widths, cells)]
+        if widths != self._widths:
+            # A column grew: re-pad the earlier rows (rare)
+            self._widths = widths
+            self._rows = [self._format(row) for row in self._values]
+            self._header = self._format_header()
+        else:
+            self._rows.append(self._format(cells))
+
+    def _format(self, cells: list) -> str:
+        return "".join(c.ljust(w) for c, w in zip(cells, self._widths))
+
+    def _format_header(self) -> str:
+        header = self._format(self.columns)
+        return f"{header}\n{'-' * len(header)}"
+
+    def display(self):
+        print()
+        print(self._header)
+        print("\n".join(self._rows))
+        print()
 
 
 # ===========================================================================
@@ -2233,20 +3358,20 @@ profiles:
 #  Main
 # ===========================================================================
 
-_results_data: dict = {
-    "Round": [], "WPM": [], "Accuracy": [],
-    "Consistency": [], "KeyCons": [],
-}
-_shutdown = False
+_results = ResultsTable(["Round", "WPM", "Accuracy", "Consistency", "KeyCons"])
+_shutdown = threading.Event()  # set on SIGINT/SIGTERM; waits wake on it
 
 
 def handle_exit(signum, frame):
-    global _shutdown
-    _shutdown = True
+    _shutdown.set()
+    # Let the typing thread finish its word and release any held keys
+    thread = _typing_thread
+    if thread is not None:
+        thread.join(timeout=2)
     print("\n\nStopping...")
-    if _results_data["Round"]:
+    if _results:
         print("\n--- Session Results ---")
-        display(_results_data)
+        _results.display()
     else:
         print("No completed rounds.")
     print("Goodbye!")
@@ -2254,7 +3379,7 @@ def handle_exit(signum, frame):
 
 
 def main():
-    global _shutdown
+    global _DEBUG_KEYS
 
     signal.signal(signal.SIGINT, handle_exit)
     signal.signal(signal.SIGTERM, handle_exit)
@@ -2264,6 +3389,7 @@ def main():
     # Issue #21: verbose mode
     if args.verbose:
         log.setLevel(logging.DEBUG)
+    _DEBUG_KEYS = log.isEnabledFor(logging.DEBUG)
 
     # Resolve target WPM
     if args.profile:
@@ -2296,7 +3422,7 @@ def main():
     print("  Canvas/Audio Stealth | Motor Chunking | Position Errors")
     print("=" * 62)
     print()
-    print(f"  OS:           {platform.system()} {platform.release()}")
+    print(f"  OS:           {_PLATFORM} {platform.release()}")
     print(f"  Target WPM:   ~{target_wpm}")
     print(f"  Profile:      {profile_name}")
     rounds_str = ("infinite" if max_rounds == float("inf")
@@ -2304,7 +3430,7 @@ def main():
     print(f"  Rounds:       {rounds_str}")
     if args.verbose:
         print(f"  Debug:        ON")
-    if target_wpm > 130:
+    if target_wpm > HIGH_SPEED_WPM:
         print("  WARNING:      High speed! Use 'words' mode to avoid detection.")
     print()
 
@@ -2312,17 +3438,23 @@ def main():
     print("Launching stealth browser...")
     driver = launch_browser()
 
-    # Calibrate CDP overhead for accurate timing
-    calibrate_cdp_overhead(driver)
+    # Send input straight to the tab's DevTools socket when reachable
+    open_cdp_socket(driver)
 
     print("  Waiting for MonkeyType...")
     if not wait_for_page_ready(driver):
         print("ERROR: MonkeyType did not load.")
         _sys.exit(1)
 
+    # Keep the page probes in the page so each read is a one-line call
+    install_page_hooks(driver)
+
     # Issue #20: dismiss any popups/cookie banners
     dismiss_popups(driver)
 
+    # Use Input.insertText for plain chars only if the page allows it
+    probe_insert_text(driver)
+
     print()
     print("MonkeyType is ready!")
     print(f"You have {INITIAL_WAIT}s to log in / pick your mode.")
@@ -2331,29 +3463,31 @@ def main():
     print()
 
     for remaining in range(INITIAL_WAIT, 0, -1):
-        if _shutdown:
-            return
         print(f"  Starting in {remaining}s...  ", end="\r")
-        time.sleep(1)
+        if _shutdown.wait(1):
+            return
     print("  Watching for tests...              ")
     print()
 
     round_num = 0
     retry_count = 0  # Issue #19: track retries
+    time_mode_warning = ("  WARNING: Time mode at %d WPM — bot detection risk!\n"
+                         "           Consider switching to 'words' mode.")
 
-    while round_num < max_rounds and not _shutdown:
+    while round_num < max_rounds and not _shutdown.is_set():
         try:
-            # Poll for test readiness
+            # Poll for test readiness (the same read returns the words)
             waiting_msg_shown = False
-            while not _shutdown:
-                if is_test_ready(driver):
+            while not _shutdown.is_set():
+                state = _poll_state(driver, 0)
+                if state["ready"]:
                     break
                 if not waiting_msg_shown:
                     print("  Waiting for a test to be ready...")
                     waiting_msg_shown = True
-                time.sleep(POLL_INTERVAL)
+                wait_for_test_ready(driver)
 
-            if _shutdown:
+            if _shutdown.is_set():
                 break
 
             round_num += 1
@@ -2365,16 +3499,13 @@ def main():
             detail_str = mode_info.get("detail", "")
             mode_display = f"{mode_str} {detail_str}".strip()
 
-            # For profile mode, randomize WPM each round
+            # For profile mode, randomize WPM each round (range resolved above)
             if args.profile:
-                wpm_lo, wpm_hi = PROFILES[args.profile]["wpm_range"]
                 target_wpm = random.randint(wpm_lo, wpm_hi)
 
             # Warn about time mode + high WPM
-            if mode_str == "time" and target_wpm > 130:
-                print(f"  WARNING: Time mode at {target_wpm} WPM — "
-                      f"bot detection risk!")
-                print(f"           Consider switching to 'words' mode.")
+            if mode_str == "time" and target_wpm > HIGH_SPEED_WPM:
+                print(time_mode_warning % target_wpm)
 
             print(f"--- Round {round_num} [{mode_display}] "
                   f"@ ~{target_wpm} WPM ---")
@@ -2382,8 +3513,7 @@ def main():
             # Issue #20: dismiss popups before each round
             dismiss_popups(driver)
 
-            # Read words
-            words = get_all_words(driver)
+            words = state["new_words"]
             if not words:
                 retry_count += 1
                 # Issue #19: prevent infinite retry
@@ -2402,7 +3532,7 @@ def main():
             # Create fresh profile for each round (Issue #17: fresh bigram speeds)
             profile = HumanProfile(target_wpm)
 
-            count, consistency_report = type_all_words(
+            count, consistency_report = run_typing_thread(
                 driver, words, profile, mode=mode_str)
 
             if count == 0:
@@ -2433,12 +3563,9 @@ def main():
             consistency = results.get("consistency")
 
             if wpm:
-                _results_data["Round"].append(round_num)
-                _results_data["WPM"].append(wpm)
-                _results_data["Accuracy"].append(acc or "?")
-                _results_data["Consistency"].append(consistency or "?")
-                _results_data["KeyCons"].append(f"{key_cons}%")
-                display(_results_data)
+                _results.add(round_num, wpm, acc or "?", consistency or "?",
+                             f"{key_cons}%")
+                _results.display()
             else:
                 print("  Could not read results (test may not have "
                       "finished).")
@@ -2449,7 +3576,8 @@ def main():
             # Issue: randomized cooldown between rounds (not fixed 3s)
             cooldown = random.uniform(2.0, 5.0)
             print(f"  Next round in {cooldown:.0f}s...")
-            time.sleep(cooldown)
+            if _shutdown.wait(cooldown):
+                break
 
             # Trigger next test
             click_next_test(driver)
@@ -2468,9 +3596,9 @@ def main():
             raise
 
     # Final summary
-    if _results_data["Round"]:
+    if _results:
         print("\n=== Session Complete ===")
-        display(_results_data)
+        _results.display()
     else:
         print("\nNo completed rounds.")
 